@@ -1,18 +1,15 @@
 """Command-Line Interface using Click."""
 
 import sys
+import functools
 import logging
 import json
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.resolve()))
-
 import click
-from rich.logging import RichHandler
+import polars as pl
 from rich.console import Console
-from rich.table import Table
 from rich import print as rprint
 
 from df_metadata_customizer.core import (
@@ -21,17 +18,8 @@ from df_metadata_customizer.core import (
     PresetService,
     song_utils,
 )
-from df_metadata_customizer.core.metadata import MetadataFields
-
-# Setup logging
-logging_handler = RichHandler(
-    show_time=True,
-    show_level=True,
-    show_path=False,
-    markup=False,
-    rich_tracebacks=True,
-)
-logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[logging_handler])
+from df_metadata_customizer.core.json_utils import write_json_file
+from df_metadata_customizer.core.metadata import FREE_TEXT_SEARCH_FIELDS, MetadataFields
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -190,9 +178,8 @@ def _apply_advanced_filter(files: list, query: str, file_manager) -> list:
         else:
             # Simple text search across multiple fields
             query_lower = query.lower()
-            search_fields = [MetadataFields.TITLE, MetadataFields.ARTIST, MetadataFields.COVER_ARTIST, MetadataFields.SPECIAL, MetadataFields.VERSION]
             
-            for field in search_fields:
+            for field in FREE_TEXT_SEARCH_FIELDS:
                 if query_lower in str(file_data.get(field, "")).lower():
                     match = True
                     break
@@ -203,6 +190,36 @@ def _apply_advanced_filter(files: list, query: str, file_manager) -> list:
     return filtered
 
 
+def _write_json_result(file_path: str, json_data: dict) -> bool:
+    """Write a preset result back to a single file. Returns True on success."""
+    try:
+        return song_utils.write_json_to_song(file_path, json_data)
+    except Exception as e:
+        logger.warning(f"Failed to process {file_path}: {e}")
+        return False
+
+
+def _setup_logging() -> None:
+    """Route log output through rich. Deferred until a command actually runs."""
+    from rich.logging import RichHandler
+
+    logging_handler = RichHandler(
+        show_time=True,
+        show_level=True,
+        show_path=False,
+        markup=False,
+        rich_tracebacks=True,
+    )
+    logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[logging_handler])
+
+
+@functools.cache
+def _get_preset_service() -> PresetService:
+    """Return the process-wide preset service, initializing settings once."""
+    SettingsManager.initialize()
+    return PresetService(SettingsManager.get_presets_folder())
+
+
 @click.group()
 @click.version_option(version="2.0.0")
 def cli() -> None:
@@ -211,7 +228,7 @@ def cli() -> None:
     Powerful tool for managing audio file metadata and applying presets to cover song collections.
     Supports: MP3, FLAC, OGG, M4A, WAV, OPUS
     """
-    pass
+    _setup_logging()
 
 
 @cli.command()
@@ -219,36 +236,39 @@ def cli() -> None:
 @click.option("--limit", "-l", default=None, type=int, help="Limit number of files to scan")
 def scan(folder: str, limit: Optional[int] = None) -> None:
     """Scan a folder for audio files and display statistics."""
+    from rich.table import Table
+
     try:
         console.print(f"\n📁 Scanning folder: [bold]{folder}[/bold]")
         
         file_manager = FileManager()
         file_manager.load_folder(folder)
         
-        files = file_manager.get_all_files()
-        
+        df = file_manager.df
         if limit:
-            files = files[:limit]
+            df = df.head(limit)
             console.print(f"(Showing first {limit} of {file_manager.df.height} files)")
         
-        if not files:
+        if df.is_empty():
             console.print("[yellow]No audio files found[/yellow]\n")
             return
         
         # Create table
-        table = Table(title=f"Found {len(files)} Audio Files")
+        table = Table(title=f"Found {df.height} Audio Files")
         table.add_column("Title", style="cyan")
         table.add_column("Artist", style="magenta")
         table.add_column("Version", style="yellow")
         table.add_column("Date", style="green")
         
-        for file_data in files:
-            title = file_data.get(MetadataFields.TITLE, "")[:30]
-            artist = file_data.get(MetadataFields.ARTIST, "")[:20]
-            version = str(file_data.get(MetadataFields.VERSION, ""))[:10]
-            date = file_data.get(MetadataFields.DATE, "")[:10]
-            
-            table.add_row(title, artist, version, date)
+        # Truncate the displayed columns natively instead of slicing per row
+        rows = df.select(
+            pl.col(MetadataFields.TITLE).str.slice(0, 30),
+            pl.col(MetadataFields.ARTIST).str.slice(0, 20),
+            pl.col(MetadataFields.VERSION).cast(pl.Utf8).str.slice(0, 10),
+            pl.col(MetadataFields.DATE).str.slice(0, 10),
+        ).fill_null("")
+        for row in rows.iter_rows():
+            table.add_row(*row)
         
         console.print(table)
         console.print(f"\n✅ Total files: {file_manager.df.height}\n")
@@ -279,8 +299,7 @@ def apply(folder: str, preset_name: str, dry_run: bool = False, filter: Optional
         df-metadata-customizer apply ./songs Default -f "artist=Lady"
     """
     try:
-        SettingsManager.initialize()
-        preset_service = PresetService(SettingsManager.get_presets_folder())
+        preset_service = _get_preset_service()
         
         # Load preset
         console.print(f"\n📋 Loading preset: [bold]{preset_name}[/bold]")
@@ -297,48 +316,62 @@ def apply(folder: str, preset_name: str, dry_run: bool = False, filter: Optional
         file_manager = FileManager()
         file_manager.load_folder(folder)
         
-        files = file_manager.get_all_files()
-        console.print(f"✅ Found {len(files)} files")
+        df = file_manager.df
+        console.print(f"✅ Found {df.height} files")
         
         # Filter if needed using advanced search syntax
         if filter:
             console.print(f"🔍 Filtering with: [bold]{filter}[/bold]")
-            files = _apply_advanced_filter(files, filter, file_manager)
-            console.print(f"✅ Filtered to {len(files)} matching files")
-        
-        # Apply preset
+            files = _apply_advanced_filter(file_manager.get_all_files(), filter, file_manager)
+            df = df.filter(pl.col("path").is_in([file_data["path"] for file_data in files]))
+            console.print(f"✅ Filtered to {df.height} matching files")
+        
+        # Evaluate rule conditions over the whole DataFrame first; files no rule
+        # can match are left as they are without touching their JSON
+        json_keys = MetadataFields.get_json_keys()
+        string_fields = [name for name, dtype in file_manager.schema.items() if dtype == pl.Utf8 and name in json_keys]
+        candidates = df.filter(PresetService.to_polars_expr(preset, string_fields))
+        paths = candidates.get_column("path").to_list()
+        current = [jsond or {} for jsond in candidates.get_column("raw_json").to_list()]
+        
+        # Apply preset to the candidates in one batch; metadata was already read
+        # from disk by load_folder
+        results = preset_service.apply_preset_batch(preset, current)
+        # Files whose JSON the preset leaves untouched need no tag rewrite
+        pending = [
+            (file_path, result)
+            for file_path, jsond, result in zip(paths, current, results)
+            if result != jsond
+        ]
+        unchanged_count = df.height - len(pending)
         applied_count = 0
         failed_count = 0
         
-        with console.status("[bold green]Applying preset...") as status:
-            for i, file_data in enumerate(files):
-                file_path = file_data.get("path", "")
-                
-                try:
-                    # Get current metadata
-                    json_data = song_utils.extract_json_from_song(file_path) or {}
-                    
-                    # Apply preset
-                    result = preset_service.apply_preset(preset, json_data)
-                    
-                    if not dry_run:
-                        # Write back
-                        success = song_utils.write_json_to_song(file_path, result)
-                        if success:
-                            applied_count += 1
-                        else:
-                            failed_count += 1
-                    else:
+        if dry_run:
+            applied_count = len(pending)
+        elif pending:
+            from rich.progress import Progress
+
+            # Tag writes are I/O-bound, so overlap them across files
+            # Progress repaints on its own refresh timer, not once per file
+            with Progress(console=console, transient=True) as progress, ThreadPoolExecutor() as executor:
+                task = progress.add_task("[bold green]Applying preset...", total=len(pending))
+                # Bind hot callables once instead of resolving them per file
+                submit = executor.submit
+                write = _write_json_result
+                advance = progress.advance
+                futures = [submit(write, file_path, result) for file_path, result in pending]
+                for future in as_completed(futures):
+                    if future.result():
                         applied_count += 1
-                    
-                    status.update(f"[bold green]Processing: {i+1}/{len(files)}")
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to process {file_path}: {e}")
-                    failed_count += 1
+                    else:
+                        failed_count += 1
+                    advance(task)
         
         mode = "[yellow](DRY RUN)[/yellow] " if dry_run else ""
         console.print(f"\n{mode}✅ Applied to {applied_count} files")
+        if unchanged_count > 0:
+            console.print(f"⏭️  {unchanged_count} files already up to date")
         if failed_count > 0:
             console.print(f"[red]❌ Failed for {failed_count} files[/red]")
         console.print()
@@ -352,10 +385,9 @@ def apply(folder: str, preset_name: str, dry_run: bool = False, filter: Optional
 def list_presets() -> None:
     """List all available presets."""
     try:
-        SettingsManager.initialize()
-        preset_service = PresetService(SettingsManager.get_presets_folder())
+        preset_service = _get_preset_service()
         
-        presets = preset_service.list_presets()
+        presets = preset_service.list_preset_summaries()
         
         if not presets:
             console.print("\n[yellow]No presets found[/yellow]\n")
@@ -363,12 +395,9 @@ def list_presets() -> None:
         
         console.print("\n📋 Available Presets:\n")
         
-        for i, preset_name in enumerate(presets, 1):
-            preset = preset_service.load_preset(preset_name)
-            if preset:
-                rule_count = len(preset.rules)
-                desc = f": {preset.description}" if preset.description else ""
-                console.print(f"  {i}. [bold]{preset_name}[/bold] ({rule_count} rules){desc}")
+        for i, summary in enumerate(presets, 1):
+            desc = f": {summary.description}" if summary.description else ""
+            console.print(f"  {i}. [bold]{summary.name}[/bold] ({summary.rule_count} rules){desc}")
         
         console.print()
         
@@ -391,8 +420,7 @@ def add_rule(preset_name: str, name: str, operator: str, value: str, action_fiel
              action_value: str, description: str) -> None:
     """Add a rule to an existing preset."""
     try:
-        SettingsManager.initialize()
-        preset_service = PresetService(SettingsManager.get_presets_folder())
+        preset_service = _get_preset_service()
         
         # Load preset
         preset = preset_service.load_preset(preset_name)
@@ -426,9 +454,10 @@ def add_rule(preset_name: str, name: str, operator: str, value: str, action_fiel
 @click.argument("preset_name")
 def show_preset(preset_name: str) -> None:
     """Show details of a preset."""
+    from rich.table import Table
+
     try:
-        SettingsManager.initialize()
-        preset_service = PresetService(SettingsManager.get_presets_folder())
+        preset_service = _get_preset_service()
         
         preset = preset_service.load_preset(preset_name)
         if not preset:
@@ -475,32 +504,25 @@ def export_metadata(folder: str, format: str, output: Optional[str] = None) -> N
         file_manager = FileManager()
         file_manager.load_folder(folder)
         
-        files = file_manager.get_all_files()
-        console.print(f"✅ Found {len(files)} files")
+        df = file_manager.df
+        console.print(f"✅ Found {df.height} files")
         
         # Set default output path
         if not output:
             output = f"metadata_export.{format}"
         
         if format == "json":
-            with open(output, "w", encoding="utf-8") as f:
-                json.dump(files, f, indent=2, ensure_ascii=False)
+            write_json_file(output, file_manager.get_all_files())
         elif format == "csv":
-            import csv
-            
-            if not files:
+            if df.is_empty():
                 console.print("[yellow]No files to export[/yellow]\n")
                 return
             
-            # Get all keys
-            all_keys = set()
-            for file_data in files:
-                all_keys.update(file_data.keys())
-            
-            with open(output, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=sorted(all_keys))
-                writer.writeheader()
-                writer.writerows(files)
+            # Object columns can't go through the native writer; store raw_json as JSON text
+            df = df.with_columns(
+                pl.Series("raw_json", [json.dumps(v, ensure_ascii=False) for v in df["raw_json"]], dtype=pl.Utf8)
+            )
+            df.select(sorted(df.columns)).write_csv(output)
         
         console.print(f"✅ Exported to: [bold]{output}[/bold]\n")
         
@@ -4,7 +4,14 @@ from df_metadata_customizer.core.metadata import MetadataFields, SongMetadata
 from df_metadata_customizer.core.file_manager import FileManager
 from df_metadata_customizer.core.rule_manager import RuleManager
 from df_metadata_customizer.core.settings_manager import SettingsManager
-from df_metadata_customizer.core.preset_service import Preset, PresetRule, PresetService, PresetCondition, PresetAction
+from df_metadata_customizer.core.preset_service import (
+    Preset,
+    PresetRule,
+    PresetService,
+    PresetCondition,
+    PresetAction,
+    PresetSummary,
+)
 from df_metadata_customizer.core import song_utils
 
 __all__ = [
@@ -18,5 +25,6 @@ __all__ = [
     "PresetService",
     "PresetCondition",
     "PresetAction",
+    "PresetSummary",
     "song_utils",
 ]
@@ -1,10 +1,41 @@
 """Audio hashing utilities for comparing raw audio data."""
 
+import functools
 import mmap
 import os
+from typing import BinaryIO
 
 import xxhash
-from mutagen.id3 import ID3, ID3NoHeaderError
+
+# Slice size fed to the incremental hasher for whole-file hashes
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def id3v2_tag_size(f: BinaryIO) -> int:
+    """
+    Return the byte length of a leading ID3v2 tag, or 0 if there is none.
+
+    Decodes the syncsafe size from the 10-byte tag header instead of
+    parsing every frame just to learn where the audio starts.
+    """
+    f.seek(0)
+    header = f.read(10)
+    if len(header) < 10 or header[:3] != b'ID3':
+        return 0
+
+    size = (header[6] << 21) | (header[7] << 14) | (header[8] << 7) | header[9]
+    size += 10
+    if header[5] & 0x10:  # footer present
+        size += 10
+    return size
+
+
+def _id3v1_footer_size(f: BinaryIO, file_size: int) -> int:
+    """Return 128 if the file ends with an ID3v1 tag, else 0. Reads only the 3-byte magic."""
+    if file_size < 128:
+        return 0
+    f.seek(file_size - 128)
+    return 128 if f.read(3) == b'TAG' else 0
 
 
 def get_audio_hash(file_path: str) -> str | None:
@@ -14,6 +45,9 @@ def get_audio_hash(file_path: str) -> str | None:
     This uses a 987-byte window that ends 1,000,000 bytes before the file end
     (excluding a possible ID3v1 footer). This matches the reference hashing
     behavior used for new song additions.
+
+    Results are cached per (path, mtime, size), so re-hashing an unchanged
+    file is free and any rewrite of the file naturally misses the cache.
     
     Args:
         file_path: Path to the audio file
@@ -22,37 +56,39 @@ def get_audio_hash(file_path: str) -> str | None:
         Hexadecimal hash string, or None if an error occurred
     """
     try:
-        file_size = os.path.getsize(file_path)
-        if file_size < 1_000_000:
-            print(f"{file_path} is too small!")
-            return None
-
-        with open(file_path, 'rb') as f:
-            footer_size = 0
-            if file_size > 128:
-                f.seek(-128, os.SEEK_END)
-                if f.read(3) == b'TAG':
-                    footer_size = 128
-
-            end_index = file_size - footer_size - 1_000_000
-            start_index = end_index - 987
-            if start_index < 0:
-                print(f"{file_path} is too small for hashing window!")
-                return None
-
-            f.seek(start_index)
-            raw_audio = f.read(987)
-            if len(raw_audio) != 987:
-                print(f"Error processing {file_path}: insufficient data read")
-                return None
-
-        return xxhash.xxh64(raw_audio).hexdigest()
+        stat = os.stat(file_path)
+        return _get_audio_hash_cached(file_path, stat.st_mtime_ns, stat.st_size)
 
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
         return None
 
 
+@functools.lru_cache(maxsize=1024)
+def _get_audio_hash_cached(file_path: str, mtime_ns: int, file_size: int) -> str | None:
+    """Hash the reference window of a file; the stat fields only key the cache."""
+    if file_size < 1_000_000:
+        print(f"{file_path} is too small!")
+        return None
+
+    with open(file_path, 'rb') as f:
+        footer_size = _id3v1_footer_size(f, file_size)
+
+        end_index = file_size - footer_size - 1_000_000
+        start_index = end_index - 987
+        if start_index < 0:
+            print(f"{file_path} is too small for hashing window!")
+            return None
+
+        f.seek(start_index)
+        raw_audio = f.read(987)
+        if len(raw_audio) != 987:
+            print(f"Error processing {file_path}: insufficient data read")
+            return None
+
+    return xxhash.xxh64(raw_audio).hexdigest()
+
+
 def get_audio_hash_optimized(file_path: str, chunk_size: int = 65536) -> str | None:
     """
     Calculate hash of raw audio data using streaming for better memory efficiency.
@@ -68,22 +104,14 @@ def get_audio_hash_optimized(file_path: str, chunk_size: int = 65536) -> str | N
         Hexadecimal hash string, or None if an error occurred
     """
     try:
-        # 1. Calculate boundaries without reading data
-        try:
-            audio_tags = ID3(file_path)
-            header_size = audio_tags.size
-        except ID3NoHeaderError:
-            header_size = 0
-
         file_size = os.path.getsize(file_path)
         
-        # Check for ID3v1 footer (128 bytes at end)
-        footer_size = 0
         with open(file_path, 'rb') as f:
-            if file_size > 128:
-                f.seek(-128, os.SEEK_END)
-                if f.read(3) == b'TAG':
-                    footer_size = 128
+            # 1. Calculate boundaries without reading data
+            header_size = id3v2_tag_size(f)
+
+            # Check for ID3v1 footer (128 bytes at end)
+            footer_size = _id3v1_footer_size(f, file_size)
 
             # 2. Stream the audio data to the hasher
             hasher = xxhash.xxh64()
@@ -122,22 +150,14 @@ def get_audio_hash_fast(file_path: str) -> str | None:
         Hexadecimal hash string, or None if an error occurred
     """
     try:
-        # 1. Get header size without reading the whole file
-        try:
-            audio_tags = ID3(file_path)
-            header_size = audio_tags.size
-        except ID3NoHeaderError:
-            header_size = 0
-
         file_size = os.path.getsize(file_path)
         
         with open(file_path, 'rb') as f:
+            # 1. Get header size without reading the whole file
+            header_size = id3v2_tag_size(f)
+
             # 2. Check for ID3v1 footer (last 128 bytes) without reading whole file
-            footer_size = 0
-            if file_size > 128:
-                f.seek(-128, os.SEEK_END)
-                if f.read(3) == b'TAG':
-                    footer_size = 128
+            footer_size = _id3v1_footer_size(f, file_size)
             
             # 3. Use memory mapping for the "raw" audio portion
             # This is significantly faster for large files
@@ -145,9 +165,16 @@ def get_audio_hash_fast(file_path: str) -> str | None:
                 return None
 
             with mmap.mmap(f.fileno(), length=0, access=mmap.ACCESS_READ) as mm:
-                # Slice the mmap (this is a memory view, not a copy)
-                raw_audio_view = mm[header_size : file_size - footer_size]
-                return xxhash.xxh64(raw_audio_view).hexdigest()
+                # Slicing mmap directly copies into bytes; a memoryview slice does not.
+                # Both views must be released before the mmap closes.
+                with memoryview(mm) as view, view[header_size : file_size - footer_size] as raw_audio_view:
+                    # Feed bounded slices to update() so other threads (the UI) get
+                    # a turn between chunks instead of waiting out one long call
+                    hasher = xxhash.xxh64()
+                    for offset in range(0, len(raw_audio_view), HASH_CHUNK_SIZE):
+                        with raw_audio_view[offset : offset + HASH_CHUNK_SIZE] as chunk:
+                            hasher.update(chunk)
+                    return hasher.hexdigest()
 
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
@@ -168,13 +195,15 @@ def get_audio_hash_short(file_path: str) -> str | None:
         Hexadecimal hash string, or None if an error occurred
     """
     try:
+        # Only the tail is hashed, so seek to it instead of reading the whole file
         with open(file_path, 'rb') as f:
-            file_data = f.read()
+            file_size = os.fstat(f.fileno()).st_size
+            footer_size = _id3v1_footer_size(f, file_size)
 
-        footer_size = 128 if file_data[-128:].startswith(b'TAG') else 0
-        
-        end_index = len(file_data) - footer_size
-        raw_audio = file_data[end_index-500:end_index]
+            end_index = file_size - footer_size
+            start_index = max(end_index - 500, 0)
+            f.seek(start_index)
+            raw_audio = f.read(end_index - start_index)
 
         return xxhash.xxh64(raw_audio).hexdigest()
 
@@ -198,15 +227,14 @@ def get_audio_hash_short_fast(file_path: str) -> str | None:
     """
     try:
         file_size = os.path.getsize(file_path)
-        footer_size = 0
         with open(file_path, 'rb') as f:
-            if file_size > 128:
-                f.seek(-128, os.SEEK_END)
-                if f.read(3) == b'TAG':
-                    footer_size = 128
+            footer_size = _id3v1_footer_size(f, file_size)
 
-            f.seek(-1000, os.SEEK_END-footer_size)
-            data = f.read(1000)
+            # Last 1000 bytes of audio before the footer
+            end_index = file_size - footer_size
+            start_index = max(end_index - 1000, 0)
+            f.seek(start_index)
+            data = f.read(end_index - start_index)
 
         return xxhash.xxh64(data).hexdigest()
 
@@ -2,19 +2,46 @@
 
 import json
 import logging
+import os
 import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import polars as pl
 
 from df_metadata_customizer.core.metadata import MetadataFields, SongMetadata
-from df_metadata_customizer.core.song_utils import extract_json_from_song, get_id3_tags
+from df_metadata_customizer.core.song_utils import SUPPORTED_FILES_TYPES, extract_json_from_song, get_id3_tags
 
 logger = logging.getLogger(__name__)
 
+# Tag reads are I/O-bound, so use more threads than cores
+LOAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# First number (including decimals) in a free-form version string
+_VERSION_RE = re.compile(r"[-+]?\d*\.\d+|\d+")
+
+
+def _iter_audio_files(folder: Path) -> Iterator[str]:
+    """Yield resolved paths of supported audio files under a folder, walking the tree once with os.scandir."""
+    pending = [os.fspath(folder)]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    # normcase keeps the platform's case rules for extensions, as rglob did
+                    elif os.path.splitext(os.path.normcase(entry.name))[1] in SUPPORTED_FILES_TYPES:
+                        # Resolve symlinks so a file reachable by two names is loaded once
+                        yield os.path.realpath(entry.path)
+        except OSError:
+            logger.warning(f"Cannot read folder: {directory}")
+
 
 class FileManager:
-    """Manages file metadata using Polars DataFrame."""
+    """Manages file metadata in a path-keyed store, exposed as a Polars DataFrame."""
 
     def __init__(self) -> None:
         """Initialize DataFrame storage."""
@@ -33,78 +60,102 @@ class FileManager:
             MetadataFields.SPECIAL: pl.Utf8,
             "raw_json": pl.Object,
         }
-        self.df = pl.DataFrame(schema=self.schema)
-        # Staging area for new/modified data before commit to DF
+        # Staging area for new/modified data before commit
         self._staging: dict[str, dict] = {}
+        # Committed records keyed by path (source of truth)
+        self._records: dict[str, dict] = {}
+        # song_id -> {version: number of files with that version}
+        self._versions: dict[str, dict[float, int]] = {}
+        # DataFrame view of _records, rebuilt on first access after a change
+        self._df: pl.DataFrame | None = None
+
+    @property
+    def df(self) -> pl.DataFrame:
+        """All committed records as a DataFrame."""
+        self.commit()
+        if self._df is None:
+            # Build column-wise so Polars ingests one list per column instead of
+            # converting every record dict row by row
+            records = self._records.values()
+            columns = {name: [record[name] for record in records] for name in self.schema}
+            self._df = pl.DataFrame(columns, schema=self.schema)
+        return self._df
 
     def commit(self) -> None:
-        """Commit staged changes to the DataFrame."""
+        """Commit staged changes to the record store."""
         if not self._staging:
             return
 
-        # Convert staging to rows
-        rows = []
         for path, jsond in self._staging.items():
-            title = jsond.get(MetadataFields.TITLE, "")
-            artist = jsond.get(MetadataFields.ARTIST, "")
-            cover_artist = jsond.get(MetadataFields.COVER_ARTIST, "")
-            song_id = f"{title}|{artist}|{cover_artist}"
+            self._discard(path)
+            record = self.build_record(path, jsond)
+            self._records[path] = record
+            counts = self._versions.setdefault(record["song_id"], {})
+            version = record[MetadataFields.VERSION]
+            counts[version] = counts.get(version, 0) + 1
+
+        self._staging.clear()
+        self._df = None
 
-            # Robust version parsing
-            raw_ver = jsond.get(MetadataFields.VERSION, 0)
+    def _discard(self, file_path: str) -> None:
+        """Drop a committed record and its entry in the version index."""
+        record = self._records.pop(file_path, None)
+        if record is None:
+            return
+
+        song_id = record["song_id"]
+        counts = self._versions[song_id]
+        version = record[MetadataFields.VERSION]
+        counts[version] -= 1
+        if not counts[version]:
+            del counts[version]
+            if not counts:
+                del self._versions[song_id]
+
+    @staticmethod
+    def build_record(file_path: str, jsond: dict) -> dict:
+        """Build the cached record (one DataFrame row) for a file's JSON data."""
+        title = jsond.get(MetadataFields.TITLE, "")
+        artist = jsond.get(MetadataFields.ARTIST, "")
+        cover_artist = jsond.get(MetadataFields.COVER_ARTIST, "")
+        song_id = f"{title}|{artist}|{cover_artist}"
+
+        # Robust version parsing
+        raw_ver = jsond.get(MetadataFields.VERSION, 0)
+        if isinstance(raw_ver, (int, float)):
+            version = float(raw_ver)
+        else:
             try:
                 version = float(raw_ver)
             except (ValueError, TypeError):
                 # Try extracting number (including decimals)
-                nums = re.findall(r"[-+]?\d*\.\d+|\d+", str(raw_ver))
-                version = float(nums[0]) if nums else 0.0
-
-            rows.append(
-                {
-                    "path": path,
-                    "song_id": song_id,
-                    MetadataFields.TITLE: title,
-                    MetadataFields.ARTIST: artist,
-                    MetadataFields.COVER_ARTIST: cover_artist,
-                    MetadataFields.VERSION: version,
-                    MetadataFields.DISC: jsond.get(MetadataFields.DISC, ""),
-                    MetadataFields.TRACK: jsond.get(MetadataFields.TRACK, ""),
-                    MetadataFields.DATE: jsond.get(MetadataFields.DATE, ""),
-                    MetadataFields.COMMENT: jsond.get(MetadataFields.COMMENT, ""),
-                    MetadataFields.SPECIAL: jsond.get(MetadataFields.SPECIAL, ""),
-                    "raw_json": jsond,
-                },
-            )
-
-        new_df = pl.DataFrame(rows, schema=self.schema, orient="row")
-
-        # Remove existing paths from main DF that are in staging
-        if self.df.height > 0:
-            staging_paths = list(self._staging.keys())
-            self.df = self.df.filter(~pl.col("path").is_in(staging_paths))
-            self.df = self.df.vstack(new_df)
-        else:
-            self.df = new_df
-
-        self._staging.clear()
+                match = _VERSION_RE.search(str(raw_ver))
+                version = float(match.group()) if match else 0.0
+
+        return {
+            "path": file_path,
+            "song_id": song_id,
+            MetadataFields.TITLE: title,
+            MetadataFields.ARTIST: artist,
+            MetadataFields.COVER_ARTIST: cover_artist,
+            MetadataFields.VERSION: version,
+            MetadataFields.DISC: jsond.get(MetadataFields.DISC, ""),
+            MetadataFields.TRACK: jsond.get(MetadataFields.TRACK, ""),
+            MetadataFields.DATE: jsond.get(MetadataFields.DATE, ""),
+            MetadataFields.COMMENT: jsond.get(MetadataFields.COMMENT, ""),
+            MetadataFields.SPECIAL: jsond.get(MetadataFields.SPECIAL, ""),
+            "raw_json": jsond,
+        }
 
     def get_song_versions(self, song_id: str) -> list[float]:
         """Get all versions for a song ID."""
         self.commit()
-        if self.df.height == 0:
-            return []
-
-        # Filter DF by song_id
-        versions = self.df.filter(pl.col("song_id") == song_id).select(MetadataFields.VERSION).unique().to_series().to_list()
-        return sorted(versions) if versions else []
+        return sorted(self._versions.get(song_id, ()))
 
     def get_latest_version(self, song_id: str) -> float:
         """Get latest version string for a song ID."""
-        versions = self.get_song_versions(song_id)
-        if not versions:
-            return 0.0
-
-        return max(versions)
+        self.commit()
+        return max(self._versions.get(song_id, ()), default=0.0)
 
     def is_latest_version(self, song_id: str, version: float) -> bool:
         """Check if a given version is the latest for a song ID."""
@@ -116,6 +167,17 @@ class FileManager:
 
     def update_file_path(self, old_path: str, new_path: str) -> None:
         """Update the file path in the cache (e.g., if a file is renamed)."""
+        if old_path not in self._staging and old_path in self._records:
+            # Re-key the committed record; its song_id and version are unchanged,
+            # so the version index needs no update
+            record = self._records.pop(old_path)
+            record["path"] = new_path
+            self._staging.pop(new_path, None)
+            self._discard(new_path)
+            self._records[new_path] = record
+            self._df = None
+            return
+
         # Get data first
         data = self.get_file_data(old_path)
 
@@ -123,17 +185,20 @@ class FileManager:
         if old_path in self._staging:
             del self._staging[old_path]
 
-        # Remove old from DF if present
-        if self.df.height > 0:
-            self.df = self.df.filter(pl.col("path") != old_path)
+        # Remove old from committed records if present
+        if old_path in self._records:
+            self._discard(old_path)
+            self._df = None
 
         # Add new to staging
         self._staging[new_path] = data
 
     def clear(self) -> None:
         """Clear the file data cache."""
-        self.df = self.df.clear()
         self._staging.clear()
+        self._records.clear()
+        self._versions.clear()
+        self._df = None
 
     def get_file_data(self, file_path: str) -> dict:
         """Get JSON data from a file."""
@@ -141,13 +206,10 @@ class FileManager:
         if file_path in self._staging:
             return self._staging[file_path]
 
-        # Check DataFrame
-        if self.df.height > 0:
-            # Filter for the path
-            res = self.df.filter(pl.col("path") == file_path)
-            if not res.is_empty():
-                row = res.row(0, named=True)
-                return row["raw_json"]
+        # Check committed data
+        record = self._records.get(file_path)
+        if record is not None:
+            return record["raw_json"]
 
         # Not found, load from disk
         jsond = extract_json_from_song(file_path) or {}
@@ -164,17 +226,14 @@ class FileManager:
         self.clear()
 
         # Find all supported audio files
-        from df_metadata_customizer.core.song_utils import SUPPORTED_FILES_TYPES
-        audio_files = []
-        for ext in SUPPORTED_FILES_TYPES:
-            audio_files.extend(folder.rglob(f"*{ext}"))
-        
-        logger.info(f"Found {len(audio_files)} audio files in {folder}")
-
-        for audio_file in audio_files:
-            file_path = str(audio_file.resolve())
-            json_data = extract_json_from_song(file_path) or {}
-            self.update_file_data(file_path, json_data)
+        file_paths = list(_iter_audio_files(folder))
+
+        logger.info(f"Found {len(file_paths)} audio files in {folder}")
+
+        # Overlap per-file tag reads; map() keeps results in scan order
+        with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+            for file_path, json_data in zip(file_paths, executor.map(extract_json_from_song, file_paths)):
+                self.update_file_data(file_path, json_data or {})
 
         self.commit()
 
@@ -0,0 +1,44 @@
+"""JSON helpers for presets, settings and embedded song metadata, using orjson when installed."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup, used when installed
+    orjson = None
+
+# json.dump emits many small chunks; batch them into large writes
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def read_json_file(path: str | Path) -> Any:
+    """Parse a UTF-8 JSON file."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def loads_json(text: str | bytes) -> Any:
+    """Parse JSON text. Invalid input raises json.JSONDecodeError either way."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def dumps_compact(data: Any) -> str:
+    """Serialize data as compact JSON (no whitespace), keeping non-ASCII text as-is."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def write_json_file(path: str | Path, data: Any) -> None:
+    """Write data as 2-space indented UTF-8 JSON, keeping files hand-editable."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
@@ -1,6 +1,7 @@
 """Core metadata models and fields."""
 
 from enum import StrEnum
+from typing import Final
 
 
 class MetadataFields(StrEnum):
@@ -49,6 +50,16 @@ class MetadataFields(StrEnum):
         return [m.value for m in cls if m.name.startswith("UI_")]
 
 
+# Fields matched by a plain (operator-free) search query, in the CLI and the UI
+FREE_TEXT_SEARCH_FIELDS: Final = (
+    MetadataFields.TITLE,
+    MetadataFields.ARTIST,
+    MetadataFields.COVER_ARTIST,
+    MetadataFields.SPECIAL,
+    MetadataFields.VERSION,
+)
+
+
 class SongMetadata:
     """A wrapper around song metadata that provides safe access and defaults."""
 
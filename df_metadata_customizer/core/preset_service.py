@@ -1,15 +1,56 @@
 """Core preset service for rule-based metadata transformation."""
 
-import json
 import logging
+import operator
+import os
 from dataclasses import dataclass, asdict, field
+from collections.abc import Callable, Collection
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
+
+import polars as pl
+
+from df_metadata_customizer.core.json_utils import read_json_file, write_json_file
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# String condition operators over (lowercased field value, lowercased condition value).
+# The latest-version operators read metadata flags instead and are handled separately.
+CONDITION_OPERATORS: Final[dict[str, Callable[[str, str], bool]]] = {
+    "is": operator.eq,
+    "contains": operator.contains,
+    "starts with": str.startswith,
+    "ends with": str.endswith,
+    "is empty": lambda field_value, _value: field_value == "",
+    "is not empty": lambda field_value, _value: field_value != "",
+}
+
+# The same operators lowered to Polars expressions over a lowercased string column
+_POLARS_CONDITION_OPERATORS: Final[dict[str, Callable[[pl.Expr, str], pl.Expr]]] = {
+    "is": lambda column, value: column == value,
+    "contains": lambda column, value: column.str.contains(value, literal=True),
+    "starts with": lambda column, value: column.str.starts_with(value),
+    "ends with": lambda column, value: column.str.ends_with(value),
+    "is empty": lambda column, _value: column == "",
+    "is not empty": lambda column, _value: column != "",
+}
+
+
+def condition_matches(metadata: dict, field: str, op: str, value: str) -> bool:
+    """Check a single rule condition against metadata (case-insensitive)."""
+    if op == "is latest version":
+        return metadata.get("_is_latest", False)
+    if op == "is not latest version":
+        return not metadata.get("_is_latest", False)
+
+    check = CONDITION_OPERATORS.get(op)
+    if check is None:
+        return False
+    return check(str(metadata.get(field, "")).lower(), str(value).lower())
+
+
+@dataclass(slots=True)
 class PresetCondition:
     """Represents a condition in a preset rule."""
 
@@ -18,7 +59,7 @@ class PresetCondition:
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PresetAction:
     """Represents an action in a preset rule."""
 
@@ -26,7 +67,7 @@ class PresetAction:
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PresetRule:
     """Represents a single rule in a preset."""
 
@@ -38,7 +79,7 @@ class PresetRule:
     logic: str = "AND"  # AND or OR
 
 
-@dataclass
+@dataclass(slots=True)
 class Preset:
     """Represents a complete preset configuration."""
 
@@ -105,10 +146,19 @@ class Preset:
             description=data.get("description", ""),
             version=data.get("version", "1.0"),
             rules=rules,
-            metadata=data.get("metadata", {}),
+            metadata=dict(data.get("metadata", {})),
         )
 
 
+@dataclass(slots=True)
+class PresetSummary:
+    """Lightweight listing entry for a preset."""
+
+    name: str
+    description: str = ""
+    rule_count: int = 0
+
+
 class PresetService:
     """Service for managing presets."""
 
@@ -116,18 +166,35 @@ class PresetService:
         """Initialize preset service."""
         self.presets_folder = Path(presets_folder)
         self.presets_folder.mkdir(parents=True, exist_ok=True)
+        # Cached preset names, keyed by the folder's mtime
+        self._list_cache: tuple[int, list[str]] | None = None
+        # Parsed preset files keyed by name, with the mtime they were read at
+        self._preset_cache: dict[str, tuple[int, dict]] = {}
 
     def load_preset(self, preset_name: str) -> Preset | None:
         """Load a preset by name."""
+        data = self._read_preset_data(preset_name)
+        return Preset.from_dict(data) if data is not None else None
+
+    def _read_preset_data(self, preset_name: str) -> dict | None:
+        """Read a preset file's parsed JSON.
+
+        Parsed files are cached by modification time, so repeated reads only
+        stat the file. Callers must not mutate the returned dict.
+        """
         preset_path = self.presets_folder / f"{preset_name}.json"
-        if not preset_path.exists():
+        try:
+            mtime = preset_path.stat().st_mtime_ns
+        except OSError:
             logger.warning(f"Preset not found: {preset_name}")
             return None
 
         try:
-            with preset_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-                return Preset.from_dict(data)
+            cached = self._preset_cache.get(preset_name)
+            if cached is None or cached[0] != mtime:
+                cached = (mtime, read_json_file(preset_path))
+                self._preset_cache[preset_name] = cached
+            return cached[1]
         except Exception:
             logger.exception(f"Error loading preset: {preset_name}")
             return None
@@ -136,8 +203,9 @@ class PresetService:
         """Save a preset."""
         preset_path = self.presets_folder / f"{preset.name}.json"
         try:
-            with preset_path.open("w", encoding="utf-8") as f:
-                json.dump(preset.to_dict(), f, indent=2, ensure_ascii=False)
+            write_json_file(preset_path, preset.to_dict())
+            self._list_cache = None
+            self._preset_cache.pop(preset.name, None)
             logger.info(f"Preset saved: {preset.name}")
             return True
         except Exception:
@@ -150,6 +218,8 @@ class PresetService:
         try:
             if preset_path.exists():
                 preset_path.unlink()
+                self._list_cache = None
+                self._preset_cache.pop(preset_name, None)
                 logger.info(f"Preset deleted: {preset_name}")
                 return True
             return False
@@ -158,52 +228,124 @@ class PresetService:
             return False
 
     def list_presets(self) -> list[str]:
-        """List all available presets."""
-        return [p.stem for p in self.presets_folder.glob("*.json")]
+        """List all available presets.
+
+        The listing is cached until the presets folder changes on disk or a
+        preset is saved/deleted through this service.
+        """
+        try:
+            mtime = self.presets_folder.stat().st_mtime_ns
+        except OSError:
+            return []
+
+        if self._list_cache is None or self._list_cache[0] != mtime:
+            with os.scandir(self.presets_folder) as entries:
+                names = [e.name[:-5] for e in entries if e.name.endswith(".json") and e.is_file()]
+            self._list_cache = (mtime, names)
+        return list(self._list_cache[1])
+
+    def list_preset_summaries(self) -> list[PresetSummary]:
+        """List all available presets with their description and rule count."""
+        summaries = []
+        for preset_name in self.list_presets():
+            data = self._read_preset_data(preset_name)
+            if data is None:
+                continue
+            summaries.append(
+                PresetSummary(
+                    name=preset_name,
+                    description=data.get("description", ""),
+                    rule_count=len(data.get("rules", [])),
+                ),
+            )
+        return summaries
 
     def apply_preset(self, preset: Preset, metadata: dict) -> dict:
         """Apply preset rules to metadata."""
-        result = dict(metadata)
+        return self.apply_preset_batch(preset, [metadata])[0]
+
+    def apply_preset_batch(self, preset: Preset, records: list[dict]) -> list[dict]:
+        """Apply preset rules to many metadata dicts, compiling the rules once.
 
+        Returns new dicts in the same order as ``records``; inputs are not modified.
+        """
         # Group rules by logic (AND/OR)
-        and_rules = [r for r in preset.rules if r.enabled and r.logic == "AND"]
-        or_rules = [r for r in preset.rules if r.enabled and r.logic == "OR"]
-
-        # Apply AND rules (all must match)
-        for rule in and_rules:
-            if self._check_condition(result, rule.condition):
-                result[rule.action.field] = rule.action.value
-
-        # Apply OR rules (any can match)
-        if or_rules:
-            for rule in or_rules:
-                if self._check_condition(result, rule.condition):
-                    result[rule.action.field] = rule.action.value
+        and_rules = [self._compile_rule(r) for r in preset.rules if r.enabled and r.logic == "AND"]
+        or_rules = [self._compile_rule(r) for r in preset.rules if r.enabled and r.logic == "OR"]
+
+        results = []
+        for metadata in records:
+            result = dict(metadata)
+
+            # Apply AND rules (all must match)
+            for matches, action_field, action_value in and_rules:
+                if matches(result):
+                    result[action_field] = action_value
+
+            # Apply OR rules (any can match)
+            for matches, action_field, action_value in or_rules:
+                if matches(result):
+                    result[action_field] = action_value
                     break
 
-        return result
+            results.append(result)
+        return results
 
     @staticmethod
-    def _check_condition(metadata: dict, condition: PresetCondition) -> bool:
-        """Check if a condition matches metadata."""
-        field_value = str(metadata.get(condition.field, "")).lower()
-        condition_value = str(condition.value).lower()
+    def to_polars_expr(preset: Preset, string_fields: Collection[str]) -> pl.Expr:
+        """Build an expression that is True for rows the preset may change.
+
+        ``string_fields`` names the string columns that mirror the JSON field of
+        the same name. Conditions on those columns are evaluated natively; any
+        other condition counts as a possible match, so rows where the expression
+        is False are guaranteed to come out of ``apply_preset`` unchanged.
+        """
+        conditions = []
+        for rule in preset.rules:
+            if not rule.enabled:
+                continue
+            condition = rule.condition
+            if condition.field not in string_fields or condition.operator in (
+                "is latest version",
+                "is not latest version",
+            ):
+                conditions.append(pl.lit(True))
+                continue
+
+            to_expr = _POLARS_CONDITION_OPERATORS.get(condition.operator)
+            if to_expr is None:
+                conditions.append(pl.lit(False))
+                continue
+            expr = to_expr(pl.col(condition.field).str.to_lowercase(), str(condition.value).lower())
+            # Nulls don't map cleanly onto the dict lookup; treat them as a match
+            conditions.append(expr.fill_null(True))
+
+        if not conditions:
+            return pl.lit(False)
+        return pl.any_horizontal(conditions)
 
-        if condition.operator == "is":
-            return field_value == condition_value
-        elif condition.operator == "contains":
-            return condition_value in field_value
-        elif condition.operator == "starts with":
-            return field_value.startswith(condition_value)
-        elif condition.operator == "ends with":
-            return field_value.endswith(condition_value)
-        elif condition.operator == "is empty":
-            return field_value == ""
-        elif condition.operator == "is not empty":
-            return field_value != ""
-        elif condition.operator == "is latest version":
-            return metadata.get("_is_latest", False)
-        elif condition.operator == "is not latest version":
-            return not metadata.get("_is_latest", False)
+    @classmethod
+    def _compile_rule(cls, rule: PresetRule) -> tuple[Callable[[dict], bool], str, str]:
+        """Pre-resolve a rule into (predicate, action field, action value)."""
+        return cls._compile_condition(rule.condition), rule.action.field, rule.action.value
 
-        return False
+    @staticmethod
+    def _compile_condition(condition: PresetCondition) -> Callable[[dict], bool]:
+        """Resolve a condition's operator once and return a predicate over metadata."""
+        if condition.operator == "is latest version":
+            return lambda metadata: metadata.get("_is_latest", False)
+        if condition.operator == "is not latest version":
+            return lambda metadata: not metadata.get("_is_latest", False)
+
+        check = CONDITION_OPERATORS.get(condition.operator)
+        if check is None:
+            return lambda metadata: False
+
+        field_name = condition.field
+        condition_value = str(condition.value).lower()
+        return lambda metadata: check(str(metadata.get(field_name, "")).lower(), condition_value)
+
+    @classmethod
+    def _check_condition(cls, metadata: dict, condition: PresetCondition) -> bool:
+        """Check if a condition matches metadata."""
+        return cls._compile_condition(condition)(metadata)
@@ -1,6 +1,8 @@
 """Audio remuxing utilities using ffmpeg."""
 
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from df_metadata_customizer.core.error_logger import ErrorLogger
 
@@ -28,7 +30,8 @@ def remux_song(file_path: str, new_path: str) -> tuple[bool, str]:
                 "-write_xing", "1",
                 new_path
             ],
-            stdout=subprocess.PIPE,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
             text=True,
             encoding='utf-8'
@@ -57,3 +60,25 @@ def remux_song(file_path: str, new_path: str) -> tuple[bool, str]:
         error_msg = f"{type(e).__name__}: {str(e)}"
         ErrorLogger.log_remux_error(filename, error_msg)
         return False, error_msg
+
+
+def remux_songs(pairs: list[tuple[str, str]], workers: int | None = None) -> list[tuple[bool, str]]:
+    """
+    Remux several audio files in parallel.
+
+    Each ffmpeg run is a separate process, so threads are enough to overlap
+    process startup and I/O across files.
+
+    Args:
+        pairs: (source path, output path) tuples
+        workers: Maximum concurrent ffmpeg processes (defaults to CPU count)
+
+    Returns:
+        One (success, error_message) tuple per pair, in input order
+    """
+    if not pairs:
+        return []
+
+    max_workers = min(len(pairs), workers or os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda pair: remux_song(*pair), pairs))
@@ -7,9 +7,17 @@ from typing import Final
 import polars as pl
 
 from df_metadata_customizer.core.metadata import MetadataFields
+from df_metadata_customizer.core.preset_service import condition_matches
 
 logger = logging.getLogger(__name__)
 
+# key<op>value search tokens; value may be quoted. Field keys are fixed, so compile once.
+_SEARCH_TOKEN_RE: Final = re.compile(
+    rf"(?i)\b({'|'.join(re.escape(k) for k in MetadataFields.get_ui_keys())})"
+    r"\s*(==|!=|>=|<=|>|<|=|~|!~)\s*(?:\"([^\"]+)\"|'([^']+)'|(\S+))",
+)
+_WHITESPACE_RE: Final = re.compile(r"\s+")
+
 
 class RuleManager:
     """Utility class for managing and applying metadata rules."""
@@ -36,14 +44,8 @@ class RuleManager:
         q_orig = q
         filters = []
 
-        # regex to find key<op>value tokens; value may be quoted
-        fields_pattern = "|".join(re.escape(k) for k in MetadataFields.get_ui_keys())
-        token_re = re.compile(
-            rf"(?i)\b({fields_pattern})\s*(==|!=|>=|<=|>|<|=|~|!~)\s*(?:\"([^\"]+)\"|'([^']+)'|(\S+))",
-        )
-
         # find all matches
-        for m in token_re.finditer(q_orig):
+        for m in _SEARCH_TOKEN_RE.finditer(q_orig):
             key = m.group(1).lower()
             op = m.group(2)
             val = m.group(3) or m.group(4) or m.group(5) or ""
@@ -55,10 +57,10 @@ class RuleManager:
                 filters.append({"field": key, "op": op, "value": val})
 
         # remove matched portions from query to leave free text
-        q_clean = token_re.sub("", q_orig)
+        q_clean = _SEARCH_TOKEN_RE.sub("", q_orig)
 
         # remaining free terms (split by whitespace, ignore empty)
-        free_terms = [t.lower() for t in re.split(r"\s+", q_clean.strip()) if t.strip()]
+        free_terms = [t.lower() for t in _WHITESPACE_RE.split(q_clean.strip()) if t.strip()]
 
         return filters, free_terms
 
@@ -85,8 +87,10 @@ class RuleManager:
 
             # Special handling for version=latest
             if field == MetadataFields.UI_VERSION and val == "_latest_":
-                if "is_latest" in filtered_df.columns:
-                    filtered_df = filtered_df.filter(pl.col("is_latest"))
+                if "song_id" in df.columns:
+                    # Latest is judged against every loaded version, not just the rows left so far
+                    latest = df.group_by("song_id").agg(pl.col(MetadataFields.VERSION).max())
+                    filtered_df = filtered_df.join(latest, on=["song_id", MetadataFields.VERSION], how="semi")
                 continue
 
             col_expr = pl.col(col_name)
@@ -147,30 +151,8 @@ class RuleManager:
         action_value: str,
     ) -> dict:
         """Apply a single conditional rule to metadata."""
-        # Check if condition matches
-        matches = False
-        field_value = str(json_data.get(field, "")).lower()
-        condition_lower = str(condition).lower()
-
-        if operator == "is":
-            matches = field_value == condition_lower
-        elif operator == "contains":
-            matches = condition_lower in field_value
-        elif operator == "starts with":
-            matches = field_value.startswith(condition_lower)
-        elif operator == "ends with":
-            matches = field_value.endswith(condition_lower)
-        elif operator == "is empty":
-            matches = field_value == ""
-        elif operator == "is not empty":
-            matches = field_value != ""
-        elif operator == "is latest version":
-            matches = json_data.get("_is_latest", False)
-        elif operator == "is not latest version":
-            matches = not json_data.get("_is_latest", False)
-
         # If condition matches, apply action
-        if matches:
+        if condition_matches(json_data, field, operator, condition):
             json_data[action_field] = action_value
 
         return json_data
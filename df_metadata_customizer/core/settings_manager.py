@@ -1,12 +1,13 @@
 """Core settings management for application configuration."""
 
-import json
 import logging
 import shutil
 import sys
 from pathlib import Path
 from typing import Any, ClassVar
 
+from df_metadata_customizer.core.json_utils import read_json_file, write_json_file
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,6 +34,13 @@ class SettingsManager:
     default_player: ClassVar[str | None] = None  # Path or command to use for playing files
     error_logging_enabled: ClassVar[bool] = True  # Enable/disable error logging to file
 
+    # Resolved once per process; the install location does not move while running
+    _base_dir: ClassVar[Path | None] = None
+    _settings_path: ClassVar[Path | None] = None
+    _presets_folder: ClassVar[Path | None] = None
+    # (presets folder mtime_ns, sorted preset files)
+    _preset_files_cache: ClassVar[tuple[int, list[Path]] | None] = None
+
     @classmethod
     def initialize(cls) -> None:
         """Initialize SettingsManager."""
@@ -58,23 +66,30 @@ class SettingsManager:
     @classmethod
     def get_base_dir(cls) -> Path:
         """Get the base directory for the application."""
-        if getattr(sys, "frozen", False):
-            # Running as bundled executable
-            return Path(sys.executable).parent
-        # Running as script
-        return Path(__file__).resolve().parent.parent.parent
+        if cls._base_dir is None:
+            if getattr(sys, "frozen", False):
+                # Running as bundled executable
+                cls._base_dir = Path(sys.executable).parent
+            else:
+                # Running as script
+                cls._base_dir = Path(__file__).resolve().parent.parent.parent
+        return cls._base_dir
 
     @classmethod
     def get_settings_path(cls) -> Path:
         """Get the path to the settings file."""
-        return cls.get_base_dir() / f"{cls.APP_NAME}_settings.json"
+        if cls._settings_path is None:
+            cls._settings_path = cls.get_base_dir() / f"{cls.APP_NAME}_settings.json"
+        return cls._settings_path
 
     @classmethod
     def get_presets_folder(cls) -> Path:
-        """Get the presets folder path, creating it if necessary."""
-        folder = cls.get_base_dir() / "presets"
-        folder.mkdir(exist_ok=True)
-        return folder
+        """Get the presets folder path, creating it on first use."""
+        if cls._presets_folder is None:
+            folder = cls.get_base_dir() / "presets"
+            folder.mkdir(exist_ok=True)
+            cls._presets_folder = folder
+        return cls._presets_folder
 
     @classmethod
     def save_settings(cls) -> None:
@@ -98,19 +113,18 @@ class SettingsManager:
             "error_logging_enabled": cls.error_logging_enabled,
         }
         try:
-            with cls.get_settings_path().open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            write_json_file(cls.get_settings_path(), data)
         except Exception:
             logger.exception("Error saving settings")
 
     @classmethod
     def load_settings(cls) -> None:
         """Load settings from JSON file."""
-        if not cls.get_settings_path().exists():
+        settings_path = cls.get_settings_path()
+        if not settings_path.exists():
             return
         try:
-            with cls.get_settings_path().open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_json_file(settings_path)
 
             cls.theme = data.get("theme", "dark")
             cls.follow_system_theme = data.get("follow_system_theme", True)
@@ -135,16 +149,26 @@ class SettingsManager:
 
     @classmethod
     def get_preset_files(cls) -> list[Path]:
-        """Get all preset files."""
+        """Get all preset files.
+
+        The listing is cached until the presets folder changes on disk or a
+        preset is saved/deleted through this class.
+        """
         presets_folder = cls.get_presets_folder()
-        return sorted(presets_folder.glob("*.json"))
+        try:
+            mtime = presets_folder.stat().st_mtime_ns
+        except OSError:
+            return []
+
+        if cls._preset_files_cache is None or cls._preset_files_cache[0] != mtime:
+            cls._preset_files_cache = (mtime, sorted(presets_folder.glob("*.json")))
+        return list(cls._preset_files_cache[1])
 
     @classmethod
     def load_preset(cls, preset_path: str | Path) -> dict | None:
         """Load a preset configuration file."""
         try:
-            with open(preset_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return read_json_file(preset_path)
         except Exception:
             logger.exception(f"Error loading preset: {preset_path}")
             return None
@@ -154,8 +178,8 @@ class SettingsManager:
         """Save a preset configuration file."""
         try:
             preset_path = cls.get_presets_folder() / f"{preset_name}.json"
-            with preset_path.open("w", encoding="utf-8") as f:
-                json.dump(preset_data, f, indent=2, ensure_ascii=False)
+            write_json_file(preset_path, preset_data)
+            cls._preset_files_cache = None
             return True
         except Exception:
             logger.exception(f"Error saving preset: {preset_name}")
@@ -168,6 +192,7 @@ class SettingsManager:
             preset_path = cls.get_presets_folder() / f"{preset_name}.json"
             if preset_path.exists():
                 preset_path.unlink()
+                cls._preset_files_cache = None
                 return True
             return False
         except Exception:
@@ -1,6 +1,7 @@
 """Core utilities for reading/writing Song ID3 tags and embedded JSON metadata."""
 
 import contextlib
+import copy
 import hashlib
 import json
 import logging
@@ -8,31 +9,115 @@ import os
 import platform
 import shutil
 import subprocess
-from io import BytesIO
+import threading
+from collections import OrderedDict
 from pathlib import Path
+from typing import Literal
 
 from mutagen.id3 import APIC, COMM, ID3, TALB, TDRC, TIT2, TPE1, TPOS, TRCK, ID3NoHeaderError
-from PIL import Image
 from tinytag import TinyTag
 
+from df_metadata_customizer.core.audio_hash import id3v2_tag_size
+from df_metadata_customizer.core.json_utils import dumps_compact, loads_json
+
 logger = logging.getLogger(__name__)
 
 # Supported audio formats (mutagen and tinytag support)
 SUPPORTED_FILES_TYPES = {".mp3", ".flac", ".ogg", ".m4a", ".wav", ".opus"}
 
+# Read size for streaming file hashes
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Head/tail window hashed by get_file_hash(mode="fast") around tag regions
+FAST_HASH_WINDOW = 64 * 1024
+
+# Number of files whose parsed tags are kept in memory
+READ_CACHE_SIZE = 4096
+
+# path -> ((mtime_ns, size), (id3, json)); shared by the loader's worker threads
+_read_cache: OrderedDict[str, tuple[tuple[int, int], tuple[dict[str, str], dict | None]]] = OrderedDict()
+_read_cache_lock = threading.Lock()
+
+
+def read_song_metadata(path: str) -> tuple[dict[str, str], dict | None]:
+    """Return (standard ID3 tags, embedded JSON dict or None) from one tag read.
+
+    Use this instead of get_id3_tags plus extract_json_from_song when both are
+    needed. Results are cached per file until its mtime or size changes or it is
+    written; each call returns fresh copies that callers may modify.
+    """
+    cached = _read_cached(path)
+    if cached is None:
+        return {}, None
+    id3, jsond = cached
+    return dict(id3), copy.deepcopy(jsond)
+
 
 def extract_json_from_song(path: str) -> dict | None:
     """Return parsed JSON dict or None."""
+    cached = _read_cached(path)
+    if cached is None:
+        return None
+    return copy.deepcopy(cached[1])
+
+
+def get_id3_tags(path: str) -> dict[str, str]:
+    """Return dictionary of standard ID3 tags."""
+    cached = _read_cached(path)
+    return dict(cached[0]) if cached is not None else {}
+
+
+def _read_cached(path: str) -> tuple[dict[str, str], dict | None] | None:
+    """Return the cached read for a file's current stat, or None if it can't be stat'ed."""
     if not path:
         return None
-    
+
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        logger.debug(f"Could not read tags from {path}: {e}")
+        return None
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _read_cache_lock:
+        entry = _read_cache.get(path)
+        if entry is not None and entry[0] == key:
+            _read_cache.move_to_end(path)
+            return entry[1]
+
+    result = _read_song_metadata(path)
+    with _read_cache_lock:
+        _read_cache[path] = (key, result)
+        _read_cache.move_to_end(path)
+        if len(_read_cache) > READ_CACHE_SIZE:
+            _read_cache.popitem(last=False)
+    return result
+
+
+def _read_song_metadata(path: str) -> tuple[dict[str, str], dict | None]:
+    """Parse the tags once for both views."""
     try:
         tags = TinyTag.get(path, tags=True, image=False)
-        if not tags:
-            return None
+    except Exception as e:
+        logger.debug(f"Could not read tags from {path}: {e}")
+        return {}, None
 
+    id3 = {
+        "Title": tags.title or "",
+        "Artist": tags.artist or "",
+        "Album": tags.album or "",
+        "Track": str(tags.track) or "",
+        "Discnumber": str(tags.disc) or "",
+        "Date": tags.year or "",
+    }
+    return id3, _json_from_tags(path, tags)
+
+
+def _json_from_tags(path: str, tags: TinyTag) -> dict | None:
+    """Combine the JSON objects found in a file's comment tags."""
+    try:
         # tag.comment and tag.other['comment'] may contain JSON texts
-        texts = tags.other.get("comment") or []  # All entries in other are lists
+        texts = list(tags.other.get("comment") or [])  # All entries in other are lists
         if tags.comment:
             texts.append(tags.comment)
 
@@ -43,7 +128,7 @@ def extract_json_from_song(path: str) -> dict | None:
         comm_data = {}
         for text in texts:
             with contextlib.suppress(json.JSONDecodeError, TypeError):
-                comm_data.update(json.loads(text))
+                comm_data.update(loads_json(text))
 
     except Exception as e:
         logger.debug(f"Could not extract JSON from {path}: {e}")
@@ -52,95 +137,161 @@ def extract_json_from_song(path: str) -> dict | None:
     return comm_data
 
 
-def get_id3_tags(path: str) -> dict[str, str]:
-    """Return dictionary of standard ID3 tags."""
-    if not path:
-        return {}
-    
-    try:
-        tags = TinyTag.get(path, tags=True, image=False)
-    except Exception:
-        logger.debug(f"Error reading ID3 tags from {path}")
-        return {}
+def invalidate_tag_cache(path: str) -> None:
+    """Forget the cached tag read for a file; call after writing its tags.
 
-    return {
-        "Title": tags.title or "",
-        "Artist": tags.artist or "",
-        "Album": tags.album or "",
-        "Track": str(tags.track) or "",
-        "Discnumber": str(tags.disc) or "",
-        "Date": tags.year or "",
-    }
+    A rewrite normally changes mtime and so misses the cache anyway; this also
+    covers same-size writes that land within the filesystem's timestamp granularity.
+    """
+    with _read_cache_lock:
+        _read_cache.pop(path, None)
 
 
-def write_json_to_song(path: str, json_data: dict | str) -> bool:
-    """Write JSON data back to song comment tag."""
+def _load_id3(path: str) -> ID3:
+    """Load a file's ID3 tags, or start an empty tag if it has none."""
     try:
-        # Try to load existing tags or create new ones
-        try:
-            tags = ID3(path)
-        except ID3NoHeaderError:
-            tags = ID3()
-
-        # Remove existing COMM frames
-        tags.delall("COMM::ved")
-
-        # Convert JSON to compact string format for saving
-        if isinstance(json_data, str):
-            # If string provided, parse and re-compact it
-            parsed = json.loads(json_data)
-            json_str = json.dumps(parsed, ensure_ascii=False, separators=(",", ":"))
+        return ID3(path)
+    except ID3NoHeaderError:
+        return ID3()
+
+
+def _set_json_frame(tags: ID3, json_data: dict | str, recompact: bool = False) -> None:
+    """Replace the embedded JSON comment frame."""
+    # Remove existing COMM frames
+    tags.delall("COMM::ved")
+
+    # Convert JSON to compact string format for saving
+    if isinstance(json_data, str):
+        json_str = dumps_compact(json.loads(json_data)) if recompact else json_data
+    else:
+        # Compact the dict
+        json_str = dumps_compact(json_data)
+
+    # Create COMM frame with UTF-8 encoding
+    tags.add(
+        COMM(
+            encoding=3,  # UTF-8
+            lang="ved",  # Use 'ved' for custom archive
+            desc="",  # Empty description
+            text=json_str,
+        ),
+    )
+
+
+def _set_id3_frames(tags: ID3, metadata: dict) -> None:
+    """Set or clear the standard text frames (title/artist/album/track/disc/date)."""
+
+    def set_or_clear(frame_id: str, frame_obj):
+        if frame_obj is None:
+            tags.delall(frame_id)
         else:
-            # Compact the dict
-            json_str = json.dumps(json_data, ensure_ascii=False, separators=(",", ":"))
-
-        # Create COMM frame with UTF-8 encoding
-        tags.add(
-            COMM(
-                encoding=3,  # UTF-8
-                lang="ved",  # Use 'ved' for custom archive
-                desc="",  # Empty description
-                text=json_str,
-            ),
-        )
-
-        # Save the tags
-        tags.save(path)
+            tags.setall(frame_id, [frame_obj])
+
+    title = str(metadata.get("Title", "")).strip()
+    artist = str(metadata.get("Artist", "")).strip()
+    album = str(metadata.get("Album", "")).strip()
+    track = str(metadata.get("Track", "")).strip()
+    disc = str(metadata.get("Discnumber", "") or metadata.get("Disc", "")).strip()
+    date = str(metadata.get("Date", "")).strip()
+
+    set_or_clear("TIT2", TIT2(encoding=3, text=title) if title else None)
+    set_or_clear("TPE1", TPE1(encoding=3, text=artist) if artist else None)
+    set_or_clear("TALB", TALB(encoding=3, text=album) if album else None)
+    set_or_clear("TRCK", TRCK(encoding=3, text=track) if track else None)
+    set_or_clear("TPOS", TPOS(encoding=3, text=disc) if disc else None)
+    set_or_clear("TDRC", TDRC(encoding=3, text=date) if date else None)
+
+
+def _set_cover_frame(tags: ID3, image_data: bytes) -> None:
+    """Replace the cover art frame."""
+    # Remove existing APIC frames
+    tags.delall("APIC")
+
+    # Add new cover art
+    tags.add(
+        APIC(
+            encoding=3,
+            mime="image/jpeg",
+            type=3,  # Front cover
+            desc="",
+            data=image_data,
+        ),
+    )
+
+
+class TagSession:
+    """Apply several tag edits to one file with a single load and a single save.
+
+    Usage::
+
+        with TagSession(path) as session:
+            session.set_json(json_data)
+            session.set_cover(image_data)
+
+    The tags are saved when the block exits normally and discarded if it raises.
+    Pass ``tags`` to edit an already loaded ID3 object instead of re-reading the file.
+    """
+
+    def __init__(self, path: str, tags: ID3 | None = None) -> None:
+        """Load the file's current tags unless they are given."""
+        self.path = path
+        self.tags = tags if tags is not None else _load_id3(path)
+
+    def __enter__(self) -> "TagSession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.save()
+
+    def set_json(self, json_data: dict | str, *, recompact: bool = False) -> None:
+        """Replace the embedded JSON (see write_json_to_song)."""
+        _set_json_frame(self.tags, json_data, recompact)
+
+    def set_id3(self, metadata: dict) -> None:
+        """Set the standard ID3 text frames (see write_id3_tags)."""
+        _set_id3_frames(self.tags, metadata)
+
+    def set_cover(self, image_data: bytes) -> None:
+        """Replace the cover art (see set_cover_art)."""
+        _set_cover_frame(self.tags, image_data)
+
+    def save(self) -> None:
+        """Write all pending edits to the file."""
+        self.tags.save(self.path)
+        invalidate_tag_cache(self.path)
+
+
+def write_json_to_song(
+    path: str,
+    json_data: dict | str,
+    *,
+    recompact: bool = False,
+    tags: ID3 | None = None,
+) -> bool:
+    """Write JSON data back to song comment tag.
+
+    A string is written as given; pass ``recompact=True`` to parse and
+    re-serialize it in compact form first. ``tags`` reuses an already loaded
+    ID3 object for the file instead of parsing it again.
+    """
+    try:
+        with TagSession(path, tags) as session:
+            session.set_json(json_data, recompact=recompact)
     except Exception:
         logger.exception("Error writing JSON to song")
         return False
     return True
 
 
-def write_id3_tags(path: str, metadata: dict) -> bool:
-    """Write standard ID3 tags (title/artist/album/track/disc/date)."""
+def write_id3_tags(path: str, metadata: dict, *, tags: ID3 | None = None) -> bool:
+    """Write standard ID3 tags (title/artist/album/track/disc/date).
+
+    ``tags`` reuses an already loaded ID3 object for the file.
+    """
     try:
-        try:
-            tags = ID3(path)
-        except ID3NoHeaderError:
-            tags = ID3()
-
-        def set_or_clear(frame_id: str, frame_obj):
-            if frame_obj is None:
-                tags.delall(frame_id)
-            else:
-                tags.setall(frame_id, [frame_obj])
-
-        title = str(metadata.get("Title", "")).strip()
-        artist = str(metadata.get("Artist", "")).strip()
-        album = str(metadata.get("Album", "")).strip()
-        track = str(metadata.get("Track", "")).strip()
-        disc = str(metadata.get("Discnumber", "") or metadata.get("Disc", "")).strip()
-        date = str(metadata.get("Date", "")).strip()
-
-        set_or_clear("TIT2", TIT2(encoding=3, text=title) if title else None)
-        set_or_clear("TPE1", TPE1(encoding=3, text=artist) if artist else None)
-        set_or_clear("TALB", TALB(encoding=3, text=album) if album else None)
-        set_or_clear("TRCK", TRCK(encoding=3, text=track) if track else None)
-        set_or_clear("TPOS", TPOS(encoding=3, text=disc) if disc else None)
-        set_or_clear("TDRC", TDRC(encoding=3, text=date) if date else None)
-
-        tags.save(path)
+        with TagSession(path, tags) as session:
+            session.set_id3(metadata)
         return True
     except Exception:
         logger.exception("Error writing ID3 tags")
@@ -159,40 +310,49 @@ def get_cover_art(path: str) -> bytes | None:
     return None
 
 
-def set_cover_art(path: str, image_data: bytes) -> bool:
-    """Set cover art for an audio file."""
+def set_cover_art(path: str, image_data: bytes, *, tags: ID3 | None = None) -> bool:
+    """Set cover art for an audio file.
+
+    ``tags`` reuses an already loaded ID3 object for the file.
+    """
     try:
-        try:
-            tags = ID3(path)
-        except ID3NoHeaderError:
-            tags = ID3()
-
-        # Remove existing APIC frames
-        tags.delall("APIC")
-
-        # Add new cover art
-        tags.add(
-            APIC(
-                encoding=3,
-                mime="image/jpeg",
-                type=3,  # Front cover
-                desc="",
-                data=image_data,
-            ),
-        )
-
-        tags.save(path)
+        with TagSession(path, tags) as session:
+            session.set_cover(image_data)
         return True
     except Exception:
         logger.exception("Error setting cover art")
         return False
 
 
-def get_file_hash(path: str) -> str:
-    """Get SHA256 hash of file for change detection."""
+def get_file_hash(path: str, mode: Literal["fast", "full"] = "full") -> str:
+    """Get SHA256 hash of file for change detection.
+
+    ``mode="full"`` hashes the whole file. ``mode="fast"`` hashes only where
+    tags live: the leading ID3v2 tag (or the first 64 KiB if there is none)
+    plus the last 64 KiB. Digests are only comparable within the same mode.
+    """
     try:
-        with open(path, "rb") as f:
-            return hashlib.sha256(f.read()).hexdigest()
+        with open(path, "rb", buffering=0) as f:
+            if mode == "fast":
+                file_size = os.fstat(f.fileno()).st_size
+                head_size = id3v2_tag_size(f) or FAST_HASH_WINDOW
+                f.seek(0)
+                h = hashlib.sha256(f.read(head_size))
+                if file_size > head_size:
+                    f.seek(max(head_size, file_size - FAST_HASH_WINDOW))
+                    h.update(f.read())
+                return h.hexdigest()
+
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, "sha256").hexdigest()
+
+            # Stream through one reusable buffer instead of reading the whole file
+            h = hashlib.sha256()
+            buf = bytearray(HASH_CHUNK_SIZE)
+            view = memoryview(buf)
+            while n := f.readinto(buf):
+                h.update(view[:n])
+            return h.hexdigest()
     except Exception:
         logger.exception("Error calculating file hash")
         return ""
@@ -1,17 +1,29 @@
 """Cover art loading and update utilities for the UI."""
 
 import logging
-from io import BytesIO
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
-from PIL import Image
 from PySide6.QtWidgets import QFileDialog, QMessageBox
 from PySide6.QtGui import QPixmap
 from PySide6.QtCore import Qt
 
+from df_metadata_customizer.core.song_utils import invalidate_tag_cache
+
 logger = logging.getLogger(__name__)
 
+MAX_COVER_WRITE_WORKERS = 8
+
+COVER_MIME_BY_EXT = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".bmp": "image/bmp",
+}
+
 
 class CoverManager:
     """Manage loading and updating cover art for selected songs."""
@@ -35,7 +47,7 @@ class CoverManager:
                     return
 
                 cover_data = None
-                file_ext = Path(file_path).suffix.lower()
+                file_ext = os.path.splitext(file_path)[1].lower()
 
                 # Handle different formats
                 if file_ext == '.mp3':
@@ -69,17 +81,7 @@ class CoverManager:
                             pass
 
                 if cover_data:
-                    img = Image.open(BytesIO(cover_data))
-                    img.thumbnail((150, 150), Image.Resampling.LANCZOS)
-
-                    img_byte_arr = BytesIO()
-                    img.save(img_byte_arr, format='PNG')
-                    img_byte_arr.seek(0)
-
-                    pixmap = QPixmap()
-                    pixmap.loadFromData(img_byte_arr.read())
-                    self.parent.cover_display.setPixmap(pixmap)
-                    self.parent.cover_display.setText("")
+                    self._display_cover_bytes(cover_data)
                 else:
                     self.parent.cover_display.clear()
                     self.parent.cover_display.setText("No cover\nimage")
@@ -91,26 +93,41 @@ class CoverManager:
             self.parent.cover_display.setText("No cover\nimage")
             logger.debug(f"Error loading cover: {e}")
 
-    def _apply_cover_to_file(self, file_path: str, image_path: str) -> tuple[bool, str]:
-        """Apply cover image to a single file. Returns (success, message)."""
+    def _display_cover_bytes(self, cover_data: bytes) -> None:
+        """Render encoded cover image bytes into the cover display."""
+        # Qt decodes JPEG/PNG natively, so there is no need for a PIL decode + PNG re-encode
+        pixmap = QPixmap()
+        pixmap.loadFromData(cover_data)
+        if pixmap.isNull():
+            self.parent.cover_display.clear()
+            self.parent.cover_display.setText("No cover\nimage")
+            return
+
+        # Only shrink, like a thumbnail; small covers keep their size
+        if pixmap.width() > 150 or pixmap.height() > 150:
+            pixmap = pixmap.scaled(
+                150,
+                150,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+        self.parent.cover_display.setPixmap(pixmap)
+        self.parent.cover_display.setText("")
+
+    def _apply_cover_to_file(self, file_path: str, image_data: bytes, mime: str) -> tuple[bool, str]:
+        """Apply already-read cover image bytes to a single file. Returns (success, message)."""
         try:
             from mutagen import File as MutagenFile
-            from mutagen.id3 import APIC, ID3
+            from mutagen.id3 import APIC
 
             if not Path(file_path).exists():
                 return False, "Song file not found."
 
-            if not Path(image_path).exists():
-                return False, "Image file not found."
-
-            with open(image_path, 'rb') as img_file:
-                image_data = img_file.read()
-
             audio = MutagenFile(file_path)
             if audio is None:
                 return False, "Unsupported file format."
 
-            file_ext = Path(file_path).suffix.lower()
+            file_ext = os.path.splitext(file_path)[1].lower()
 
             # Handle different formats
             if file_ext == '.mp3':
@@ -118,7 +135,7 @@ class CoverManager:
                 if audio.tags is None:
                     audio.add_tags()
                 audio.tags.delall('APIC')
-                audio.tags.add(APIC(encoding=3, mime='image/jpeg', type=3, desc='', data=image_data))
+                audio.tags.add(APIC(encoding=3, mime=mime, type=3, desc='', data=image_data))
             
             elif file_ext == '.flac':
                 # FLAC uses Vorbis comments and Picture
@@ -130,7 +147,7 @@ class CoverManager:
                 # Create new picture
                 picture = Picture()
                 picture.type = 3  # Cover (front)
-                picture.mime = 'image/jpeg'
+                picture.mime = mime
                 picture.desc = ''
                 picture.data = image_data
                 audio.add_picture(picture)
@@ -142,11 +159,8 @@ class CoverManager:
                 if audio.tags is None:
                     audio.add_tags()
                 
-                # Determine cover format
-                if image_path.lower().endswith('.png'):
-                    cover_format = MP4Cover.FORMAT_PNG
-                else:
-                    cover_format = MP4Cover.FORMAT_JPEG
+                # MP4 only distinguishes PNG from JPEG
+                cover_format = MP4Cover.FORMAT_PNG if mime == "image/png" else MP4Cover.FORMAT_JPEG
                 
                 audio.tags['covr'] = [MP4Cover(image_data, imageformat=cover_format)]
             
@@ -157,7 +171,7 @@ class CoverManager:
                 
                 picture = Picture()
                 picture.type = 3  # Cover (front)
-                picture.mime = 'image/jpeg'
+                picture.mime = mime
                 picture.desc = ''
                 picture.data = image_data
                 
@@ -170,6 +184,7 @@ class CoverManager:
                 return False, f"Cover art not supported for {file_ext} files."
 
             audio.save()
+            invalidate_tag_cache(file_path)
             return True, ""
 
         except Exception as e:
@@ -209,25 +224,42 @@ class CoverManager:
             QMessageBox.warning(self.parent, "Warning", "No valid songs selected.")
             return
 
-        # Apply cover to all selected files
+        # Read the image once for the whole batch
+        try:
+            image_data = Path(image_path).read_bytes()
+        except OSError as e:
+            QMessageBox.warning(self.parent, "Warning", f"Could not read image file: {e}")
+            return
+        mime = COVER_MIME_BY_EXT.get(os.path.splitext(image_path)[1].lower(), "image/jpeg")
+
+        file_paths = [path for idx in indices if (path := self.parent.song_files[idx].get('path', ''))]
+
+        # Apply cover to all selected files; tag rewrites are I/O-bound, so overlap them
         successes = 0
         failures = []
 
-        for idx in indices:
-            file_data = self.parent.song_files[idx]
-            file_path = file_data.get('path', '')
-            if not file_path:
-                continue
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_COVER_WRITE_WORKERS, len(file_paths)))) as executor:
+            results = list(executor.map(
+                lambda path: self._apply_cover_to_file(path, image_data, mime),
+                file_paths,
+            ))
 
-            success, error_msg = self._apply_cover_to_file(file_path, image_path)
+        for file_path, (success, error_msg) in zip(file_paths, results):
             if success:
                 successes += 1
             else:
                 filename = Path(file_path).name
                 failures.append(f"{filename}: {error_msg}")
 
-        # Update display for first selected item
-        if indices and successes > 0:
+        # Update display for first selected item; if it was written, show the bytes
+        # we already hold instead of re-opening the song and extracting them again
+        first_path = self.parent.song_files[indices[0]].get('path', '')
+        if file_paths and file_paths[0] == first_path and results[0][0]:
+            try:
+                self._display_cover_bytes(image_data)
+            except Exception as e:
+                logger.debug(f"Error displaying cover: {e}")
+        elif successes > 0:
             self.load_cover_image(self.parent.song_files[indices[0]])
 
         # Show results
@@ -4,6 +4,7 @@ import sys
 import json
 import logging
 import contextlib
+import os
 from pathlib import Path
 from typing import Optional, Any, Dict, List
 
@@ -17,7 +18,7 @@ from PySide6.QtCore import Qt, QSize, QTimer, QByteArray
 from PySide6.QtGui import QIcon, QPalette, QColor, QFont
 
 from df_metadata_customizer.core import FileManager, SettingsManager, PresetService, RuleManager
-from df_metadata_customizer.core.metadata import MetadataFields
+from df_metadata_customizer.core.metadata import FREE_TEXT_SEARCH_FIELDS, MetadataFields
 from df_metadata_customizer.core.song_utils import write_json_to_song
 from df_metadata_customizer.core.error_logger import ErrorLogger
 from df_metadata_customizer.ui.progress_dialog import ProgressDialog
@@ -716,9 +717,10 @@ class MainWindow(QMainWindow):
                             value = str(ver)
                     except:
                         pass
-                # For File column, show only filename not full path
+                # For File column, show only filename not full path (plain string
+                # op; this runs for every row on each rebuild)
                 if key == "path" and value:
-                    value = Path(value).name
+                    value = os.path.basename(value)
                 # Truncate long values
                 value_str = str(value)
                 is_truncated = len(value_str) > 60
@@ -977,9 +979,8 @@ class MainWindow(QMainWindow):
                 else:
                     # Simple text search across multiple fields
                     query_lower = query.lower()
-                    search_fields = ["Title", "Artist", "CoverArtist", "Special", "Version"]
                     
-                    for field in search_fields:
+                    for field in FREE_TEXT_SEARCH_FIELDS:
                         if query_lower in str(file_data.get(field, "")).lower():
                             match = True
                             break
@@ -1066,12 +1067,14 @@ class MainWindow(QMainWindow):
                     QMessageBox.critical(self, "Error", "Failed to save JSON to file")
                     return
                 
-                # Update in-memory data after successful save
-                self.song_files[self.current_selected_file]['raw_json'] = new_data
+                # Update in-memory data after successful save; only this file
+                # changed, so stage it instead of reloading the whole folder
+                self.file_manager.update_file_data(file_path, new_data)
+                self.song_files[self.current_selected_file] = self.file_manager.build_record(file_path, new_data)
                 
                 self.save_json_btn.setEnabled(False)
-                # Refresh the folder to reload file data
-                self.refresh_current_folder()
+                # Re-run the active search (which re-sorts) so the edited row is re-matched
+                self.on_search_changed()
                 custom_dialogs.information(self, "Success", "JSON updated successfully!")
         except json.JSONDecodeError as e:
             custom_dialogs.critical(self, "Error", f"Invalid JSON: {e}")
@@ -1597,6 +1600,7 @@ By Artist:
     def closeEvent(self, event):
         """Handle close."""
         self.save_settings()
+        self.song_editor_manager.shutdown()
         event.accept()
 
 
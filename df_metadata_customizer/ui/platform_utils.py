@@ -1,5 +1,6 @@
 """Cross-platform file and folder operations utilities."""
 
+import functools
 import subprocess
 import platform
 import os
@@ -71,9 +72,17 @@ def _try_run(command: list[str], env: dict) -> bool:
 def get_available_players() -> List[Tuple[str, str]]:
     """Get list of available media players on the system.
     
+    The probe runs once per session; context menus call this on every right-click.
+    
     Returns:
         List of tuples (display_name, command/path)
     """
+    return list(_detect_available_players())
+
+
+@functools.cache
+def _detect_available_players() -> Tuple[Tuple[str, str], ...]:
+    """Probe the system for known media players."""
     system = platform.system()
     players = []
     
@@ -139,7 +148,7 @@ def get_available_players() -> List[Tuple[str, str]]:
             if shutil.which(cmd):
                 players.append((name, cmd))
     
-    return players
+    return tuple(players)
 
 
 def open_file_with_player(file_path: str, player_path: str | None = None) -> None:
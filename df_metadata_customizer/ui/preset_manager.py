@@ -2,6 +2,8 @@
 
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable
 from PySide6.QtWidgets import (
@@ -16,6 +18,9 @@ from df_metadata_customizer.ui.rule_widgets import NoScrollComboBox
 
 logger = logging.getLogger(__name__)
 
+# Tag reads/writes are I/O-bound, so use more threads than cores
+APPLY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 class PresetManager:
     """Manages preset operations: load, save, create, delete, and apply."""
@@ -247,16 +252,10 @@ class PresetManager:
                     if idx is not None:
                         indices.append(idx)
                 
-                applied = 0
-                for idx in indices:
-                    if idx < len(self.parent.song_files):
-                        file_data = self.parent.song_files[idx]
-                        file_path = file_data.get("path", "")
-                        raw_json = file_data.get("raw_json", {}) or {}
-                        updated_json = self.parent._apply_rules_to_metadata(raw_json)
-                        id3_payload = self.parent._build_id3_metadata(raw_json, file_path, updated_json)
-                        if file_path and write_id3_tags(file_path, id3_payload):
-                            applied += 1
+                song_files = self.parent.song_files
+                applied = self._write_rule_results(
+                    [song_files[idx] for idx in indices if idx < len(song_files)]
+                )
 
                 # Refresh the folder to reload file data
                 self.parent.refresh_current_folder()
@@ -280,15 +279,7 @@ class PresetManager:
         
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                applied = 0
-                for idx in range(len(self.parent.song_files)):
-                    file_data = self.parent.song_files[idx]
-                    file_path = file_data.get("path", "")
-                    raw_json = file_data.get("raw_json", {}) or {}
-                    updated_json = self.parent._apply_rules_to_metadata(raw_json)
-                    id3_payload = self.parent._build_id3_metadata(raw_json, file_path, updated_json)
-                    if file_path and write_id3_tags(file_path, id3_payload):
-                        applied += 1
+                applied = self._write_rule_results(self.parent.song_files)
 
                 # Refresh the folder to reload file data
                 self.parent.refresh_current_folder()
@@ -298,3 +289,23 @@ class PresetManager:
                 
             except Exception as e:
                 QMessageBox.critical(self.parent, "Error", f"Failed to apply preset:\n{e}")
+
+    def _write_rule_results(self, files: list[dict]) -> int:
+        """Apply the current rules to files and write their ID3 tags. Returns the number written."""
+        # Rules are read from the UI, so evaluate them here on the GUI thread
+        jobs = []
+        for file_data in files:
+            file_path = file_data.get("path", "")
+            if not file_path:
+                continue
+            raw_json = file_data.get("raw_json", {}) or {}
+            jobs.append((file_path, raw_json, self.parent._apply_rules_to_metadata(raw_json)))
+
+        def write(job: tuple[str, dict, dict]) -> bool:
+            file_path, raw_json, updated_json = job
+            id3_payload = self.parent._build_id3_metadata(raw_json, file_path, updated_json)
+            return write_id3_tags(file_path, id3_payload)
+
+        # Each file's tag read and write is independent, so overlap them
+        with ThreadPoolExecutor(max_workers=APPLY_WORKERS) as executor:
+            return sum(executor.map(write, jobs))
@@ -145,7 +145,7 @@ class PreviewPanelManager:
             preview_album = id3_data.get("Album", preview_album)
 
         song_key = (title, artist, file_data.get(MetadataFields.COVER_ARTIST, ""))
-        versions = []
+        versions_seen: set[str] = set()
         for f in self.parent.song_files:
             f_key = (
                 f.get(MetadataFields.TITLE, ""),
@@ -154,9 +154,9 @@ class PreviewPanelManager:
             )
             if f_key == song_key:
                 ver = f.get(MetadataFields.VERSION, "")
-                if ver and ver not in versions:
-                    versions.append(str(ver))
-        versions.sort()
+                if ver:
+                    versions_seen.add(str(ver))
+        versions = sorted(versions_seen)
 
         def fmt_num(val):
             if val == "-":
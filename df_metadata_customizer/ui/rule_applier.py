@@ -3,6 +3,7 @@
 import re
 
 from df_metadata_customizer.core.metadata import MetadataFields
+from df_metadata_customizer.core.preset_service import condition_matches
 from df_metadata_customizer.core.song_utils import get_id3_tags
 
 
@@ -14,26 +15,7 @@ class RuleApplier:
 
     def rule_matches(self, json_data: dict, field: str, operator: str, condition: str) -> bool:
         """Check if a rule condition matches against json data."""
-        field_value = str(json_data.get(field, "")).lower()
-        condition_lower = str(condition).lower()
-
-        if operator == "is":
-            return field_value == condition_lower
-        if operator == "contains":
-            return condition_lower in field_value
-        if operator == "starts with":
-            return field_value.startswith(condition_lower)
-        if operator == "ends with":
-            return field_value.endswith(condition_lower)
-        if operator == "is empty":
-            return field_value == ""
-        if operator == "is not empty":
-            return field_value != ""
-        if operator == "is latest version":
-            return json_data.get("_is_latest", False)
-        if operator == "is not latest version":
-            return not json_data.get("_is_latest", False)
-        return False
+        return condition_matches(json_data, field, operator, condition)
 
     def render_template(self, template: str, data: dict) -> str:
         """Render a template like '{Artist} ({CoverArtist})' using data values."""
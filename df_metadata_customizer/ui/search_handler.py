@@ -1,6 +1,6 @@
 """Search handling utilities for filtering songs."""
 
-from df_metadata_customizer.core.metadata import MetadataFields
+from df_metadata_customizer.core.metadata import FREE_TEXT_SEARCH_FIELDS, MetadataFields
 
 
 class SearchHandler:
@@ -179,8 +179,7 @@ class SearchHandler:
 
                 else:
                     query_lower = query.lower()
-                    search_fields = ["Title", "Artist", "CoverArtist", "Special", "Version"]
-                    for field in search_fields:
+                    for field in FREE_TEXT_SEARCH_FIELDS:
                         if query_lower in str(file_data.get(field, "")).lower():
                             match = True
                             break
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import json
+import os
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -27,22 +29,25 @@ from PySide6.QtWidgets import (
     QScrollArea,
     QMenu,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QPixmap, QFontMetrics, QCursor
 
 from mutagen.id3 import ID3, ID3NoHeaderError, TIT2, TPE1, TALB, TRCK, TPOS, TDRC, TPE2, APIC, COMM
 
 from df_metadata_customizer.core.metadata import MetadataFields
 from df_metadata_customizer.core.settings_manager import SettingsManager
-from df_metadata_customizer.core.song_utils import extract_json_from_song, get_id3_tags, get_cover_art
-from df_metadata_customizer.core.preset_service import PresetService
-from df_metadata_customizer.core.remuxer import remux_song
+from df_metadata_customizer.core.song_utils import get_cover_art, invalidate_tag_cache, read_song_metadata
+from df_metadata_customizer.core.preset_service import PresetService, condition_matches
+from df_metadata_customizer.core.json_utils import dumps_compact
+from df_metadata_customizer.core.remuxer import remux_song, remux_songs
 from df_metadata_customizer.core.audio_hash import get_audio_hash
 from df_metadata_customizer.ui.rule_widgets import NoScrollComboBox
 from df_metadata_customizer.ui.platform_utils import open_file_with_player, get_available_players
 
 
 ALBUM_ARTIST = "QueenPb + vedal987"
+HASHING_PLACEHOLDER = "Hashing…"
+HASH_POLL_INTERVAL_MS = 50
 
 
 class SongEditorManager:
@@ -60,8 +65,12 @@ class SongEditorManager:
         self._active_menu = None  # Track active context menu
         self._original_id3: dict[str, str] = {}  # Store original ID3 values from file
         self._preset_applied: bool = False  # Track if preset has been applied
+        self._id3_field_dimmed: dict[str, bool] = {}  # Last applied style per ID3 field
         self._theme_colors: dict | None = None
         self._is_dark: bool = True
+        # Remux + hash runs off the UI thread; one worker keeps loads in order
+        self._hash_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="song-hash")
+        self._hash_future: Future | None = None  # Hash for the current source, if still running
 
         self.pending_tree: QTreeWidget | None = None
         self.source_label: QLabel | None = None
@@ -570,7 +579,7 @@ class SongEditorManager:
         title_edit = QLineEdit()
         title_edit.setFixedHeight(h_scale)
         self._style_input_field(title_edit)
-        title_edit.textChanged.connect(lambda: self._on_id3_field_edited())
+        title_edit.textChanged.connect(lambda: self._on_id3_field_edited("Title"))
         form.addRow("Title:", title_edit)
         out["Title"] = title_edit
         
@@ -578,7 +587,7 @@ class SongEditorManager:
         artist_edit = QLineEdit()
         artist_edit.setFixedHeight(h_scale)
         self._style_input_field(artist_edit)
-        artist_edit.textChanged.connect(lambda: self._on_id3_field_edited())
+        artist_edit.textChanged.connect(lambda: self._on_id3_field_edited("Artist"))
         form.addRow("Artist:", artist_edit)
         out["Artist"] = artist_edit
         
@@ -586,7 +595,7 @@ class SongEditorManager:
         album_edit = QLineEdit()
         album_edit.setFixedHeight(h_scale)
         self._style_input_field(album_edit)
-        album_edit.textChanged.connect(lambda: self._on_id3_field_edited())
+        album_edit.textChanged.connect(lambda: self._on_id3_field_edited("Album"))
         form.addRow("Album:", album_edit)
         out["Album"] = album_edit
         
@@ -696,26 +705,14 @@ class SongEditorManager:
         self.current_edit_id = None
 
     def load_from_path(self, file_path: str, json_data: dict | None = None) -> None:
-        jsond = json_data or extract_json_from_song(file_path) or {}
-        id3 = get_id3_tags(file_path)
+        id3, embedded_json = read_song_metadata(file_path)
+        jsond = json_data or embedded_json or {}
         cover = get_cover_art(file_path)
 
         # Store original ID3 values and mark preset as not applied
         self._original_id3 = id3.copy()
         self._preset_applied = False
 
-        # Remux and compute xxHash when file is chosen
-        try:
-            temp_output = Path(file_path).parent / f"temp_{Path(file_path).stem}.mp3"
-            remux_song(file_path, str(temp_output))
-            xxhash_value = get_audio_hash(str(temp_output)) or ""
-            if temp_output.exists():
-                temp_output.unlink()
-            if xxhash_value:
-                jsond["xxHash"] = xxhash_value
-        except Exception as e:
-            print(f"Warning: Could not compute xxHash: {e}")
-
         self._current_cover_bytes = cover
         self._apply_cover_preview(cover)
 
@@ -725,6 +722,73 @@ class SongEditorManager:
         self.current_edit_id = None
         self._update_action_button_styles()
 
+        # Remux and compute xxHash when file is chosen, unless the song's JSON
+        # already carries one: tag edits never touch the hashed audio window
+        if jsond.get("xxHash"):
+            self._cancel_hash()
+        else:
+            self._start_hash(file_path)
+
+    def _start_hash(self, file_path: str) -> None:
+        """Remux and hash the source on the worker thread, then show the xxHash."""
+        self._set_xxhash_display(HASHING_PLACEHOLDER)
+        # Entries added while hashing would be saved without an xxHash
+        self._set_hash_pending(True)
+        future = self._hash_executor.submit(self._remux_and_hash, file_path)
+        self._hash_future = future
+        self._poll_hash(future)
+
+    def _poll_hash(self, future: Future) -> None:
+        if not future.done():
+            QTimer.singleShot(HASH_POLL_INTERVAL_MS, lambda: self._poll_hash(future))
+            return
+        if future is not self._hash_future:
+            # Editor moved on to another source; re-enable unless a newer hash is running
+            if self._hash_future is None:
+                self._set_hash_pending(False)
+            return
+
+        self._hash_future = None
+        self._set_hash_pending(False)
+        try:
+            xxhash_value = future.result()
+        except Exception as e:
+            print(f"Warning: Could not compute xxHash: {e}")
+            xxhash_value = ""
+        self._set_xxhash_display(xxhash_value or "-")
+
+    def _cancel_hash(self) -> None:
+        """Drop any hash still running for a previous source."""
+        self._hash_future = None
+        self._set_hash_pending(False)
+
+    def _set_hash_pending(self, pending: bool) -> None:
+        for btn in (self.add_btn, self.update_btn):
+            if btn:
+                btn.setEnabled(not pending)
+
+    def shutdown(self) -> None:
+        """Stop the hash worker; call when the window closes."""
+        self._hash_future = None
+        self._hash_executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _remux_and_hash(file_path: str) -> str:
+        source = Path(file_path)
+        temp_output = source.parent / f"temp_{source.stem}.mp3"
+        try:
+            remux_song(file_path, str(temp_output))
+            return get_audio_hash(str(temp_output)) or ""
+        finally:
+            if temp_output.exists():
+                temp_output.unlink()
+
+    def _set_xxhash_display(self, text: str) -> None:
+        field = self.json_fields.get("xxHash")
+        if isinstance(field, QLabel):
+            field.setText(text)
+            self._set_field_tooltip(field, text)
+
     def _set_source_label(self, path: str) -> None:
         if self.source_label:
             # Truncate long paths from the middle
@@ -842,7 +906,7 @@ class SongEditorManager:
             if isinstance(filename_field, QLabel):
                 # Get source extension, default to .mp3
                 source_path = self._current_source_path()
-                source_ext = Path(source_path).suffix if source_path else ".mp3"
+                source_ext = os.path.splitext(source_path)[1] if source_path else ".mp3"
                 filename = self._generate_filename(jsond, source_ext)
                 filename_field.setText(filename)
                 self._set_field_tooltip(filename_field, filename)
@@ -869,13 +933,40 @@ class SongEditorManager:
         field.setText(comm_text)
         self._set_field_tooltip(field, comm_text)
 
-    def _on_id3_field_edited(self) -> None:
+    def _on_id3_field_edited(self, key: str) -> None:
         """Handle manual edits to ID3 fields - update styling to reflect changes."""
-        # Update styling when user manually edits fields
-        self._update_id3_field_styling()
+        # Only the edited field can have changed state; restyling every field
+        # on each keystroke is wasted work
+        self._update_id3_field_style(key)
 
-    def _update_id3_field_styling(self) -> None:
+    def _update_id3_field_styling(self, *, force: bool = False) -> None:
         """Update styling of ID3 fields to show if they're original (italic) or modified (normal)."""
+        for key in self.id3_fields:
+            self._update_id3_field_style(key, force=force)
+
+    def _update_id3_field_style(self, key: str, *, force: bool = False) -> None:
+        """Update styling of a single ID3 field (italic/dimmed when showing the original value).
+
+        The stylesheet is only re-applied when the field switches between the two
+        states, unless ``force`` is set (e.g. after a theme change).
+        """
+        if key in ("Filename", "Discnumber", "Track", "Date", "COMM_eng_preview", "Comment"):
+            # Skip fields that are display-only or driven by JSON
+            return
+        field = self.id3_fields.get(key)
+        if not isinstance(field, QLineEdit):
+            return
+
+        # Check if current value matches original value
+        current_value = field.text().strip()
+        original_value = self._original_id3.get(key, "").strip()
+
+        # If no preset applied and value matches original, show in italic/dimmed
+        dimmed = bool(not self._preset_applied and current_value == original_value and original_value)
+        if not force and self._id3_field_dimmed.get(key) == dimmed:
+            return
+        self._id3_field_dimmed[key] = dimmed
+
         c = self._theme_colors or {
             "bg_primary": "#1e1e1e",
             "bg_secondary": "#2b2b2b",
@@ -886,36 +977,22 @@ class SongEditorManager:
         }
         dim_bg = c.get("bg_secondary", c["bg_primary"])
         dim_text = c.get("text_secondary", "#888888")
-        for key, field in self.id3_fields.items():
-            if key in ("Filename", "Discnumber", "Track", "Date", "COMM_eng_preview", "Comment"):
-                # Skip fields that are display-only or driven by JSON
-                continue
-            if isinstance(field, QLabel):
-                continue
-            if not isinstance(field, QLineEdit):
-                continue
-            
-            # Check if current value matches original value
-            current_value = field.text().strip()
-            original_value = self._original_id3.get(key, "").strip()
-            
-            # If no preset applied and value matches original, show in italic/dimmed
-            if not self._preset_applied and current_value == original_value and original_value:
-                field.setStyleSheet(f"""
-                    QLineEdit {{
-                        background-color: {dim_bg};
-                        color: {dim_text};
-                        border: 1px solid {c['border']};
-                        border-radius: 4px;
-                        padding: 4px 8px;
-                        font-style: italic;
-                    }}
-                    QLineEdit:focus {{ border: 2px solid {c['button']}; }}
-                """)
-            else:
-                # Normal styling for modified or preset-applied values
-                self._style_input_field(field)
 
+        if dimmed:
+            field.setStyleSheet(f"""
+                QLineEdit {{
+                    background-color: {dim_bg};
+                    color: {dim_text};
+                    border: 1px solid {c['border']};
+                    border-radius: 4px;
+                    padding: 4px 8px;
+                    font-style: italic;
+                }}
+                QLineEdit:focus {{ border: 2px solid {c['button']}; }}
+            """)
+        else:
+            # Normal styling for modified or preset-applied values
+            self._style_input_field(field)
 
     def _apply_cover_preview(self, cover_bytes: bytes | None) -> None:
         if not self.cover_label:
@@ -974,7 +1051,7 @@ class SongEditorManager:
                 # xxHash is display-only, get from label
                 if isinstance(field, QLabel):
                     xxhash_val = field.text().strip()
-                    if xxhash_val and xxhash_val != "-":
+                    if xxhash_val and xxhash_val not in ("-", HASHING_PLACEHOLDER):
                         data[key] = xxhash_val
             else:
                 if hasattr(field, 'text'):
@@ -1025,7 +1102,7 @@ class SongEditorManager:
         id3_data = self._collect_id3_data()
 
         # Get source file extension
-        source_ext = Path(source_path).suffix if source_path else ".mp3"
+        source_ext = os.path.splitext(source_path)[1] if source_path else ".mp3"
 
         entry = {
             "id": self._new_entry_id() if self.current_edit_id is None else self.current_edit_id,
@@ -1301,6 +1378,7 @@ class SongEditorManager:
         entry_id = item.data(0, Qt.ItemDataRole.UserRole)
         for entry in self.pending_songs:
             if entry.get("id") == entry_id:
+                self._cancel_hash()
                 self.current_edit_id = entry_id
                 self._set_source_label(entry.get("source_path", ""))
                 self._fill_json_fields(entry.get("json", {}))
@@ -1338,6 +1416,7 @@ class SongEditorManager:
             self.pending_tree.clear()
 
     def reset_editor(self) -> None:
+        self._cancel_hash()
         self._set_source_label("(none)")
         self._original_id3 = {}
         self._preset_applied = False
@@ -1550,26 +1629,7 @@ class SongEditorManager:
         return result
 
     def _rule_matches(self, json_data: dict, field: str, operator: str, condition: str) -> bool:
-        field_value = str(json_data.get(field, "")).lower()
-        condition_lower = str(condition).lower()
-
-        if operator == "is":
-            return field_value == condition_lower
-        if operator == "contains":
-            return condition_lower in field_value
-        if operator == "starts with":
-            return field_value.startswith(condition_lower)
-        if operator == "ends with":
-            return field_value.endswith(condition_lower)
-        if operator == "is empty":
-            return field_value == ""
-        if operator == "is not empty":
-            return field_value != ""
-        if operator == "is latest version":
-            return json_data.get("_is_latest", False)
-        if operator == "is not latest version":
-            return not json_data.get("_is_latest", False)
-        return False
+        return condition_matches(json_data, field, operator, condition)
 
     def _render_template(self, template: str, data: dict) -> str:
         def repl(match):
@@ -1592,16 +1652,19 @@ class SongEditorManager:
         if not out_dir:
             return
 
-        errors = []
-        for entry in self.pending_songs:
-            source_path = entry.get("source_path", "")
-            filename = entry.get("filename", "")
-            if not source_path or not filename:
-                continue
+        out_dir_path = Path(out_dir)
+        jobs = [
+            (entry, str(out_dir_path / entry["filename"]))
+            for entry in self.pending_songs
+            if entry.get("source_path") and entry.get("filename")
+        ]
+        # Run the ffmpeg remuxes concurrently, then tag the outputs in order
+        remux_results = remux_songs([(entry["source_path"], output_path) for entry, output_path in jobs])
 
-            output_path = str(Path(out_dir) / filename)
+        errors = []
+        for (entry, output_path), (success, error_msg) in zip(jobs, remux_results):
+            filename = entry["filename"]
             try:
-                success, error_msg = remux_song(source_path, output_path)
                 if not success:
                     errors.append(f"Remux failed: {filename} - {error_msg}")
                     continue
@@ -1673,14 +1736,16 @@ class SongEditorManager:
         
         # Keep the JSON in ved language for compatibility
         tags.delall("COMM::ved")
-        json_str = json.dumps(json_data, ensure_ascii=False, separators=(",", ":"))
+        json_str = dumps_compact(json_data)
         tags.add(COMM(encoding=3, lang="ved", desc="", text=json_str))
 
         if cover_bytes:
             tags.delall("APIC")
             tags.add(APIC(encoding=3, mime="image/jpeg", type=3, desc="", data=cover_bytes))
 
-        tags.save(path, v2_version=4)    
+        tags.save(path, v2_version=4)
+        invalidate_tag_cache(path)
+
     def update_theme(self, theme_colors: dict, is_dark: bool):
         """Update song editor components with current theme colors."""
         self._theme_colors = theme_colors
@@ -1789,4 +1854,4 @@ class SongEditorManager:
                     """)
 
         # Re-apply ID3 styling to reflect theme and original/modified state
-        self._update_id3_field_styling()
\ No newline at end of file
+        self._update_id3_field_styling(force=True)
\ No newline at end of file
@@ -1,7 +1,23 @@
 """Sorting handler for multi-level sorting."""
 
+from typing import Final
+
 from df_metadata_customizer.core.metadata import MetadataFields
 
+# Sort control label -> song record key
+SORT_FIELD_MAP: Final = {
+    "Title": MetadataFields.TITLE,
+    "Artist": MetadataFields.ARTIST,
+    "Cover Artist": MetadataFields.COVER_ARTIST,
+    "Version": MetadataFields.VERSION,
+    "Date": MetadataFields.DATE,
+    "Disc": MetadataFields.DISC,
+    "Track": MetadataFields.TRACK,
+    "Special": MetadataFields.SPECIAL,
+    "Filename": MetadataFields.FILE,
+}
+NUMERIC_SORT_FIELDS: Final = frozenset({"Version", "Date", "Disc", "Track"})
+
 
 class ReverseStr(str):
     """String subclass that reverses comparison operators for descending sort."""
@@ -70,26 +86,13 @@ class SortHandler:
             else:
                 file_data = self.parent.song_files[idx]
                 keys = []
-                numeric_fields = {"Version", "Date", "Disc", "Track"}
 
                 for field_text, ascending in sort_keys:
-                    field_map = {
-                        "Title": MetadataFields.TITLE,
-                        "Artist": MetadataFields.ARTIST,
-                        "Cover Artist": MetadataFields.COVER_ARTIST,
-                        "Version": MetadataFields.VERSION,
-                        "Date": MetadataFields.DATE,
-                        "Disc": MetadataFields.DISC,
-                        "Track": MetadataFields.TRACK,
-                        "Special": MetadataFields.SPECIAL,
-                        "Filename": MetadataFields.FILE,
-                    }
-
-                    field = field_map.get(field_text)
+                    field = SORT_FIELD_MAP.get(field_text)
                     if field:
                         val = file_data.get(field, "")
 
-                        if field_text in numeric_fields:
+                        if field_text in NUMERIC_SORT_FIELDS:
                             try:
                                 if field_text == "Track":
                                     has_denom, num_val = self._extract_numeric_value(str(val))
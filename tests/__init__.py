@@ -0,0 +1 @@
+"""Tests for df_metadata_customizer."""
@@ -0,0 +1,43 @@
+"""Tests for the ID3 tag boundary helpers used by the audio hashes."""
+
+import io
+
+import pytest
+
+from df_metadata_customizer.core.audio_hash import _id3v1_footer_size, id3v2_tag_size
+
+
+def _id3v2_header(size: int, flags: int = 0) -> bytes:
+    """Build a 10-byte ID3v2.4 header declaring a tag body of ``size`` bytes."""
+    syncsafe = bytes((size >> shift) & 0x7F for shift in (21, 14, 7, 0))
+    return b"ID3" + bytes((4, 0, flags)) + syncsafe
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        (_id3v2_header(257) + b"\x00" * 300, 267),
+        (_id3v2_header(257, flags=0x10) + b"\x00" * 300, 277),
+        (_id3v2_header(0x0FFFFFFF), 0x0FFFFFFF + 10),
+        (b"\xff\xfb" + b"\x00" * 100, 0),
+        (b"ID3\x04", 0),
+        (b"", 0),
+    ],
+)
+def test_id3v2_tag_size(data: bytes, expected: int) -> None:
+    """The tag length is decoded from the syncsafe header, including header and footer."""
+    assert id3v2_tag_size(io.BytesIO(data)) == expected
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        (b"\x00" * 200 + b"TAG" + b"\x00" * 125, 128),
+        (b"\x00" * 328, 0),
+        (b"TAG" + b"\x00" * 125, 128),
+        (b"TAG" + b"\x00" * 100, 0),
+    ],
+)
+def test_id3v1_footer_size(data: bytes, expected: int) -> None:
+    """Only a TAG magic exactly 128 bytes before the end counts as an ID3v1 footer."""
+    assert _id3v1_footer_size(io.BytesIO(data), len(data)) == expected
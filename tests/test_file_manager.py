@@ -0,0 +1,64 @@
+"""Tests for the folder scan used by FileManager.load_folder."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from df_metadata_customizer.core.file_manager import _iter_audio_files
+
+
+def _touch(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"")
+    return path
+
+
+def test_iter_audio_files_walks_subfolders_and_skips_other_files(tmp_path: Path) -> None:
+    """Supported files are found at any depth; other extensions are ignored."""
+    expected = {
+        _touch(tmp_path / "a.mp3"),
+        _touch(tmp_path / "b.flac"),
+        _touch(tmp_path / "nested" / "deeper" / "c.opus"),
+        _touch(tmp_path / "nested" / "d.m4a"),
+    }
+    _touch(tmp_path / "cover.jpg")
+    _touch(tmp_path / "nested" / "notes.txt")
+    _touch(tmp_path / "mp3")
+
+    found = list(_iter_audio_files(tmp_path))
+
+    assert len(found) == len(expected)
+    assert {Path(path) for path in found} == {path.resolve() for path in expected}
+
+
+def test_iter_audio_files_yields_resolved_paths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Paths are absolute and resolved even when the folder is given relatively."""
+    song = _touch(tmp_path / "library" / "song.ogg")
+    monkeypatch.chdir(tmp_path)
+
+    assert list(_iter_audio_files(Path("library"))) == [str(song.resolve())]
+
+
+def test_iter_audio_files_resolves_file_symlinks(tmp_path: Path) -> None:
+    """A symlinked song is reported under its target's path."""
+    target = _touch(tmp_path / "real" / "song.mp3")
+    link = tmp_path / "links" / "alias.mp3"
+    link.parent.mkdir()
+    try:
+        link.symlink_to(target)
+    except OSError:
+        pytest.skip("symlinks are not available")
+
+    found = list(_iter_audio_files(tmp_path / "links"))
+
+    assert found == [str(target.resolve())]
+
+
+@pytest.mark.skipif(os.path.normcase("A") == "a", reason="extension case is ignored on this platform")
+def test_iter_audio_files_extension_match_is_case_sensitive(tmp_path: Path) -> None:
+    """Upper-case extensions are skipped on case-sensitive platforms, as with rglob."""
+    _touch(tmp_path / "LOUD.MP3")
+    quiet = _touch(tmp_path / "quiet.mp3")
+
+    assert list(_iter_audio_files(tmp_path)) == [str(quiet.resolve())]
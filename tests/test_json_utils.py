@@ -0,0 +1,52 @@
+"""Tests for the JSON helpers, with and without orjson."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from df_metadata_customizer.core import json_utils
+
+DATA = {"Title": "Café ☕", "Version": 1.5, "Tags": ["a", "b"], "Nested": {"Empty": [], "None": None}}
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test once on the stdlib json fallback and once on orjson, if installed."""
+    if request.param == "orjson":
+        monkeypatch.setattr(json_utils, "orjson", pytest.importorskip("orjson"))
+    else:
+        monkeypatch.setattr(json_utils, "orjson", None)
+    return request.param
+
+
+@pytest.mark.usefixtures("backend")
+def test_dumps_compact_has_no_whitespace_and_keeps_unicode() -> None:
+    """Compact output matches json.dumps with tight separators and raw non-ASCII text."""
+    assert json_utils.dumps_compact(DATA) == json.dumps(DATA, ensure_ascii=False, separators=(",", ":"))
+
+
+@pytest.mark.usefixtures("backend")
+def test_loads_json_round_trips_str_and_bytes() -> None:
+    """Text and UTF-8 bytes parse to the same data."""
+    text = json_utils.dumps_compact(DATA)
+    assert json_utils.loads_json(text) == DATA
+    assert json_utils.loads_json(text.encode()) == DATA
+
+
+@pytest.mark.usefixtures("backend")
+def test_loads_json_raises_json_decode_error() -> None:
+    """Invalid input raises json.JSONDecodeError whichever backend parses it."""
+    with pytest.raises(json.JSONDecodeError):
+        json_utils.loads_json("{not json")
+
+
+@pytest.mark.usefixtures("backend")
+def test_write_json_file_is_indented_utf8(tmp_path: Path) -> None:
+    """Files are 2-space indented UTF-8 and read back unchanged."""
+    path = tmp_path / "preset.json"
+    json_utils.write_json_file(path, DATA)
+
+    assert path.read_text(encoding="utf-8") == json.dumps(DATA, indent=2, ensure_ascii=False)
+    assert json_utils.read_json_file(path) == DATA
+    assert json_utils.read_json_file(str(path)) == DATA
@@ -0,0 +1,117 @@
+"""Tests for preset condition matching and batch application."""
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from df_metadata_customizer.core.file_manager import FileManager
+from df_metadata_customizer.core.metadata import MetadataFields
+from df_metadata_customizer.core.preset_service import (
+    Preset,
+    PresetAction,
+    PresetCondition,
+    PresetRule,
+    PresetService,
+    condition_matches,
+)
+
+SONGS = [
+    {"Title": "Moonlight", "Artist": "Neuro", "CoverArtist": "Evil", "Version": "1", "Special": ""},
+    {"Title": "Sunrise", "Artist": "NEURO-sama", "CoverArtist": "", "Version": "2", "Special": "karaoke"},
+    {"Title": "Starlight", "Artist": "Vedal", "CoverArtist": "Neuro", "Version": "1.5", "Comment": "duet"},
+    {"Title": "", "Artist": "Anny", "Version": "3"},
+]
+
+OPERATORS = ["is", "contains", "starts with", "ends with", "is empty", "is not empty", "bogus"]
+
+
+def _rule(field: str, op: str, value: str, action_field: str, action_value: str, logic: str = "AND") -> PresetRule:
+    return PresetRule(
+        name=f"{field} {op} {value}",
+        condition=PresetCondition(field=field, operator=op, value=value),
+        action=PresetAction(field=action_field, value=action_value),
+        logic=logic,
+    )
+
+
+@pytest.mark.parametrize(
+    ("field", "op", "value", "expected"),
+    [
+        ("Title", "is", "SUNRISE", True),
+        ("Title", "is", "sun", False),
+        ("Artist", "contains", "sama", True),
+        ("Artist", "starts with", "NEURO", True),
+        ("Title", "ends with", "RISE", True),
+        ("Special", "is empty", "", False),
+        ("Comment", "is empty", "", True),
+        ("Special", "is not empty", "", True),
+        ("Title", "no such operator", "sunrise", False),
+    ],
+)
+def test_condition_matches_string_operators(field: str, op: str, value: str, *, expected: bool) -> None:
+    """String operators compare case-insensitively, and missing fields read as empty."""
+    assert condition_matches(SONGS[1], field, op, value) is expected
+
+
+def test_condition_matches_latest_version_flags() -> None:
+    """The latest-version operators read the _is_latest flag instead of a field."""
+    assert condition_matches({"_is_latest": True}, "Version", "is latest version", "")
+    assert not condition_matches({"_is_latest": True}, "Version", "is not latest version", "")
+    assert condition_matches({}, "Version", "is not latest version", "")
+
+
+def test_apply_preset_batch_matches_per_record_apply(tmp_path: Path) -> None:
+    """Batch application gives the same results as applying to each record, without mutating inputs."""
+    preset = Preset(
+        name="test",
+        rules=[
+            _rule("Artist", "contains", "neuro", "Special", "neuro"),
+            _rule("Special", "is", "neuro", "Comment", "chained"),
+            _rule("Title", "starts with", "star", "Date", "2024", logic="OR"),
+            _rule("Title", "is not empty", "", "Date", "never", logic="OR"),
+        ],
+    )
+    service = PresetService(tmp_path)
+    originals = [dict(song) for song in SONGS]
+
+    results = service.apply_preset_batch(preset, SONGS)
+
+    assert SONGS == originals
+    assert results == [service.apply_preset(preset, song) for song in SONGS]
+    assert results[0]["Comment"] == "chained"
+    assert results[2]["Date"] == "2024"
+    assert results[3] == SONGS[3]
+
+
+@pytest.mark.parametrize("op", OPERATORS)
+@pytest.mark.parametrize("field", ["Title", "Artist", "CoverArtist", "Special", "Comment", "Version"])
+@pytest.mark.parametrize("value", ["", "neuro", "LIGHT", "1"])
+def test_prefilter_never_excludes_a_row_the_preset_changes(tmp_path: Path, field: str, op: str, value: str) -> None:
+    """A row the Polars prefilter rejects always comes out of apply_preset_batch unchanged."""
+    file_manager = FileManager()
+    for i, song in enumerate(SONGS):
+        file_manager.update_file_data(f"/music/{i}.mp3", song)
+    df = file_manager.df
+
+    preset = Preset(name="test", rules=[_rule(field, op, value, "Special", "changed")])
+    json_keys = MetadataFields.get_json_keys()
+    string_fields = [name for name, dtype in file_manager.schema.items() if dtype == pl.Utf8 and name in json_keys]
+
+    excluded = df.filter(~PresetService.to_polars_expr(preset, string_fields))
+    current = excluded.get_column("raw_json").to_list()
+
+    service = PresetService(tmp_path)
+    assert service.apply_preset_batch(preset, current) == current
+
+
+def test_prefilter_keeps_every_row_for_latest_version_rules() -> None:
+    """Latest-version conditions cannot be judged per row, so no row is filtered out."""
+    file_manager = FileManager()
+    for i, song in enumerate(SONGS):
+        file_manager.update_file_data(f"/music/{i}.mp3", song)
+
+    preset = Preset(name="test", rules=[_rule("Version", "is latest version", "", "Special", "latest")])
+    kept = file_manager.df.filter(PresetService.to_polars_expr(preset, [MetadataFields.TITLE]))
+
+    assert kept.height == len(SONGS)